@@ -1,9 +1,13 @@
 """Aggregation module for creating time series from events."""
 
-import json
 import logging
+import mmap
+import os
 from pathlib import Path
+from typing import Iterator, Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from nokchart.models import EventType
@@ -11,11 +15,155 @@ from nokchart.models import EventType
 logger = logging.getLogger(__name__)
 
 
+def iter_events(events_file: Path) -> Iterator[dict]:
+    """Iterate events from a JSONL file one at a time.
+
+    Blank lines are skipped and invalid lines are logged and skipped.
+
+    Args:
+        events_file: Path to events.jsonl
+
+    Yields:
+        Parsed event dictionaries
+    """
+    if not events_file.exists():
+        logger.error(f"Events file not found: {events_file}")
+        return
+
+    count = 0
+    with open(events_file, "rb") as f:
+        # mmap cannot map an empty file
+        if not os.fstat(f.fileno()).st_size:
+            logger.info("Loaded 0 events")
+            return
+
+        # Map the file read-only; pages are faulted in lazily and readline()
+        # scans for newlines in C without going through text-mode decoding
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line_num, line in enumerate(iter(mm.readline, b""), 1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON at line {line_num}: {e}")
+                    continue
+
+                count += 1
+                yield event
+
+    logger.info(f"Loaded {count} events")
+
+
+def _format_timestamps(start: pd.Timestamp, secs: np.ndarray) -> np.ndarray:
+    """Format ``start + secs`` as strings in the same layout pandas writes to CSV.
+
+    Formatting a tz-aware datetime column dominates ``to_csv`` time, so the
+    strings are built with NumPy instead. Every row shares the sub-second part
+    and UTC offset of ``start``, which only needs to be inspected once.
+
+    Args:
+        start: Timezone-aware timestamp for sec=0
+        secs: Seconds elapsed since start
+
+    Returns:
+        Array of strings like "2026-01-22 12:00:05.005000+09:00"
+    """
+    if start.nanosecond:
+        unit = "ns"
+    elif start.microsecond:
+        unit = "us"
+    else:
+        unit = "s"
+
+    local = start.tz_localize(None).to_datetime64() + secs.astype("timedelta64[s]")
+    formatted = np.char.replace(np.datetime_as_string(local, unit=unit), "T", " ")
+    return np.char.add(formatted, start.isoformat()[-6:])
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average with partial windows at the start.
+
+    Equivalent to ``rolling(window, min_periods=1).mean()`` for integer counts,
+    computed from a single cumulative sum.
+
+    Args:
+        values: Integer counts
+        window: Window size in rows
+
+    Returns:
+        Float array of window means
+    """
+    csum = np.concatenate(([0], np.cumsum(values)))
+    upper = np.arange(1, len(values) + 1)
+    lower = np.maximum(upper - window, 0)
+    return (csum[upper] - csum[lower]) / (upper - lower)
+
+
+class _EventStats:
+    """Running event counts and t_ms range for Aggregator.get_statistics."""
+
+    def __init__(self):
+        self.total_events = 0
+        self.chat_count = 0
+        self.donation_count = 0
+        self.min_t_ms = None
+        self.max_t_ms = None
+
+    def add(self, event: dict) -> None:
+        self.total_events += 1
+
+        event_type = event.get("type")
+        if event_type == EventType.CHAT.value:
+            self.chat_count += 1
+        elif event_type == EventType.DONATION.value:
+            self.donation_count += 1
+
+        t_ms = event.get("t_ms")
+        if t_ms is not None:
+            if self.min_t_ms is None or t_ms < self.min_t_ms:
+                self.min_t_ms = t_ms
+            if self.max_t_ms is None or t_ms > self.max_t_ms:
+                self.max_t_ms = t_ms
+
+    def to_dict(self) -> dict:
+        if not self.total_events:
+            return {}
+
+        # Get time range
+        duration_sec = (
+            (self.max_t_ms - self.min_t_ms) / 1000 if self.min_t_ms is not None else 0
+        )
+
+        return {
+            "total_events": self.total_events,
+            "chat_events": self.chat_count,
+            "donation_events": self.donation_count,
+            "duration_sec": duration_sec,
+        }
+
+
 class Aggregator:
     """Aggregates events into time series."""
 
-    def __init__(self, events_file: Path):
+    def __init__(self, events_file: Path, keep_chat_text: bool = False):
+        """
+        Args:
+            events_file: Path to events.jsonl
+            keep_chat_text: Keep (t_ms, text) of chat messages from
+                build_time_series in ``chat_messages`` so later stages can reuse
+                them instead of reading events.jsonl again
+        """
         self.events_file = events_file
+        self.keep_chat_text = keep_chat_text
+        self.chat_messages: list[tuple[int, str]] = []
+        # Frames written by the last build_time_series call, keyed like its
+        # returned paths, so later stages can skip reading the CSVs back
+        self.time_series: dict[str, pd.DataFrame] = {}
+        # Statistics gathered during the last full read of events_file
+        self._statistics: Optional[dict] = None
 
     def build_time_series(
         self,
@@ -36,131 +184,114 @@ class Aggregator:
         """
         logger.info(f"Building time series from {self.events_file}")
 
-        # Load events
-        events = self._load_events()
-        if not events:
-            logger.warning("No events found")
-            return {}
-
-        # Convert to DataFrame
-        df = pd.DataFrame(events)
-
-        # Filter chat events
-        chat_df = df[df["type"] == EventType.CHAT.value].copy()
-
-        if chat_df.empty:
+        # Single pass over the file: keep only what the histogram and the
+        # stream start reference need, no intermediate DataFrame
+        t_ms = []
+        received_at = []
+        chat_messages = []
+        stats = _EventStats()
+        for event in self._iter_events():
+            stats.add(event)
+            if event.get("type") == EventType.CHAT.value:
+                t_ms.append(event["t_ms"])
+                received_at.append(event.get("received_at"))
+                if self.keep_chat_text and event.get("text"):
+                    chat_messages.append((event["t_ms"], event["text"]))
+        self.chat_messages = chat_messages
+        self._statistics = stats.to_dict()
+
+        if not t_ms:
             logger.warning("No chat events found")
             return {}
 
-        # Convert t_ms to seconds
-        chat_df["sec"] = (chat_df["t_ms"] / 1000).astype(int)
+        # Convert t_ms to seconds and build the 1-second histogram once;
+        # coarser buckets are derived from it
+        secs = np.asarray(t_ms, dtype=np.int64) // 1000
+        first_sec = int(secs.min())
+        counts_1s = np.bincount(secs - first_sec)
+
+        # Get first event time (UTC) as stream start reference. Only the minimum
+        # is needed, so parse once with the vectorized ISO 8601 path instead of
+        # storing a converted column; "ISO8601" also accepts timestamps that
+        # were serialized without fractional seconds.
+        stream_start_time = pd.to_datetime(received_at, utc=True, format="ISO8601").min()
 
-        # Parse received_at timestamps for actual broadcast time (UTC)
-        chat_df["received_at"] = pd.to_datetime(chat_df["received_at"], utc=True)
-        # Get first event time as stream start reference
-        stream_start_time = chat_df["received_at"].min()
+        # Timestamps are reported in KST (UTC+9); convert the origin once
+        start_kst = stream_start_time.tz_convert("Asia/Seoul")
 
         output_files = {}
+        self.time_series = {}
 
         # Create time series for each bucket size
         for bucket_sec in bucket_sizes:
-            ts_df = self._create_time_series(chat_df, bucket_sec, stream_start_time)
+            ts_df = self._create_time_series(counts_1s, first_sec, bucket_sec, start_kst)
 
             # Add rolling average if requested (for 1-minute buckets)
             if rolling_window > 0 and bucket_sec == 60:
                 # Convert rolling_window from seconds to minutes for 60s buckets
                 rolling_minutes = max(1, rolling_window // 60)
-                ts_df[f"chat_count_rolling_{rolling_window}s"] = (
-                    ts_df["chat_count"].rolling(window=rolling_minutes, min_periods=1).mean()
+                ts_df[f"chat_count_rolling_{rolling_window}s"] = _rolling_mean(
+                    ts_df["chat_count"].to_numpy(), rolling_minutes
                 )
 
             # Save to CSV
             output_file = output_dir / f"chat_ts_{bucket_sec}s.csv"
             ts_df.to_csv(output_file, index=False)
             output_files[f"{bucket_sec}s"] = output_file
+            self.time_series[f"{bucket_sec}s"] = ts_df
 
             logger.info(f"Created time series: {output_file} ({len(ts_df)} rows)")
 
         return output_files
 
-    def _load_events(self) -> list[dict]:
-        """Load events from JSONL file."""
-        events = []
-
-        if not self.events_file.exists():
-            logger.error(f"Events file not found: {self.events_file}")
-            return events
-
-        with open(self.events_file) as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+    def _iter_events(self) -> Iterator[dict]:
+        """Iterate events from JSONL file one at a time."""
+        return iter_events(self.events_file)
 
-                try:
-                    event = json.loads(line)
-                    events.append(event)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                    continue
+    def _create_time_series(
+        self,
+        counts_1s: np.ndarray,
+        first_sec: int,
+        bucket_sec: int,
+        start_kst: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """Create time series with specified bucket size.
 
-        logger.info(f"Loaded {len(events)} events")
-        return events
-
-    def _create_time_series(self, chat_df: pd.DataFrame, bucket_sec: int, stream_start_time: pd.Timestamp) -> pd.DataFrame:
-        """Create time series with specified bucket size."""
-        # Group by bucket
-        if bucket_sec == 1:
-            grouped = chat_df.groupby("sec").size().reset_index(name="chat_count")
-            grouped.columns = ["sec", "chat_count"]
-        else:
-            # For larger buckets, create bucket column
-            chat_df["bucket"] = (chat_df["sec"] / bucket_sec).astype(int)
-            grouped = chat_df.groupby("bucket").size().reset_index(name="chat_count")
-            # Convert bucket back to seconds (start of bucket)
-            grouped["sec"] = grouped["bucket"] * bucket_sec
-            grouped = grouped[["sec", "chat_count"]]
-
-        # Fill gaps with zeros
-        if not grouped.empty:
-            min_sec = grouped["sec"].min()
-            max_sec = grouped["sec"].max()
-            all_secs = pd.DataFrame(
-                {"sec": range(min_sec, max_sec + bucket_sec, bucket_sec)}
-            )
-            grouped = all_secs.merge(grouped, on="sec", how="left").fillna(0)
-            grouped["chat_count"] = grouped["chat_count"].astype(int)
+        Args:
+            counts_1s: Dense 1-second chat counts starting at first_sec
+            first_sec: Second of the first chat event
+            bucket_sec: Bucket size in seconds
+            start_kst: KST timestamp corresponding to sec=0
+        """
+        # Sum adjacent 1-second bins into buckets aligned to multiples of
+        # bucket_sec. Padding keeps the reshape exact; empty buckets stay zero.
+        first_bucket = first_sec // bucket_sec
+        lead = first_sec - first_bucket * bucket_sec
+        trail = -(lead + len(counts_1s)) % bucket_sec
+        counts = np.pad(counts_1s, (lead, trail)).reshape(-1, bucket_sec).sum(axis=1)
+
+        grouped = pd.DataFrame(
+            {
+                "sec": (np.arange(len(counts)) + first_bucket) * bucket_sec,
+                "chat_count": counts,
+            }
+        )
 
         # Add actual timestamp column (stream start + seconds elapsed)
-        # Convert to KST (UTC+9)
-        if not grouped.empty:
-            grouped["timestamp"] = stream_start_time + pd.to_timedelta(grouped["sec"], unit="s")
-            grouped["timestamp"] = grouped["timestamp"].dt.tz_convert("Asia/Seoul")
+        grouped["timestamp"] = _format_timestamps(start_kst, grouped["sec"].to_numpy())
 
         return grouped
 
     def get_statistics(self) -> dict:
-        """Get basic statistics from events."""
-        events = self._load_events()
-        if not events:
-            return {}
-
-        df = pd.DataFrame(events)
+        """Get basic statistics from events.
 
-        chat_count = len(df[df["type"] == EventType.CHAT.value])
-        donation_count = len(df[df["type"] == EventType.DONATION.value])
-
-        # Get time range
-        if "t_ms" in df.columns and not df.empty:
-            min_t_ms = df["t_ms"].min()
-            max_t_ms = df["t_ms"].max()
-            duration_sec = (max_t_ms - min_t_ms) / 1000
-        else:
-            duration_sec = 0
+        Reuses the counts gathered by build_time_series when it has already
+        read the file, so callers can use both without a second read.
+        """
+        if self._statistics is None:
+            stats = _EventStats()
+            for event in self._iter_events():
+                stats.add(event)
+            self._statistics = stats.to_dict()
 
-        return {
-            "total_events": len(events),
-            "chat_events": chat_count,
-            "donation_events": donation_count,
-            "duration_sec": duration_sec,
-        }
+        return dict(self._statistics)
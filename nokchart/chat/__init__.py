@@ -4,7 +4,12 @@ Chzzk WebSocket chat client with robust reconnection logic.
 
 from nokchart.chat.client import ChzzkChatClient
 from nokchart.chat.models import ChatMessage, DonationMessage
-from nokchart.chat.http import get_live_status, get_chat_channel_id, get_access_token
+from nokchart.chat.http import (
+    get_live_status,
+    get_chat_channel_id,
+    get_access_token,
+    close_session,
+)
 from nokchart.chat.exceptions import (
     ChzzkChatError,
     ConnectionError,
@@ -20,6 +25,7 @@ __all__ = [
     "get_live_status",
     "get_chat_channel_id",
     "get_access_token",
+    "close_session",
     "ChzzkChatError",
     "ConnectionError",
     "ConnectionLostError",
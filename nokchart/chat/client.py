@@ -4,7 +4,7 @@ Main Chzzk chat client with reconnection logic.
 
 import asyncio
 import logging
-from typing import Optional, Callable, Awaitable, Dict, Any
+from typing import Optional, Callable, Awaitable, Dict, Any, Tuple
 
 from nokchart.chat.websocket import ChzzkWebSocket
 from nokchart.chat.reconnect import ReconnectionManager
@@ -20,6 +20,15 @@ from nokchart.chat.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Chat/Special chat commands; their body is a list of messages
+_CHAT_CMDS = frozenset((93101, 93102))
+
+# msgTypeCode -> (event name, parser)
+_MESSAGE_HANDLERS = {
+    1: ("on_chat", ChatMessage.from_raw),  # TEXT
+    10: ("on_donation", DonationMessage.from_raw),  # DONATION
+}
+
 
 class ChzzkChatClient:
     """
@@ -53,7 +62,8 @@ class ChzzkChatClient:
         )
 
         self._running = False
-        self._event_handlers: Dict[str, Callable] = {}
+        # event name -> (handler, whether it is a coroutine function)
+        self._event_handlers: Dict[str, Tuple[Callable, bool]] = {}
 
         # Statistics
         self._total_reconnects = 0
@@ -79,16 +89,18 @@ class ChzzkChatClient:
             - on_donation(message: DonationMessage): Called for donations
         """
         event_name = func.__name__
-        self._event_handlers[event_name] = func
+        # Resolve coroutine-ness once here rather than on every dispatch
+        self._event_handlers[event_name] = (func, asyncio.iscoroutinefunction(func))
         logger.debug(f"Registered event handler: {event_name}")
         return func
 
     async def _dispatch_event(self, event_name: str, *args, **kwargs) -> None:
         """Dispatch an event to registered handlers."""
-        handler = self._event_handlers.get(event_name)
-        if handler:
+        entry = self._event_handlers.get(event_name)
+        if entry:
+            handler, is_coroutine = entry
             try:
-                if asyncio.iscoroutinefunction(handler):
+                if is_coroutine:
                     await handler(*args, **kwargs)
                 else:
                     handler(*args, **kwargs)
@@ -136,44 +148,37 @@ class ChzzkChatClient:
             msg: Raw message dictionary from WebSocket
         """
         cmd = msg.get("cmd")
-        body = msg.get("bdy")
+        if cmd not in _CHAT_CMDS:
+            logger.debug("Received message with cmd=%s", cmd)
+            return
 
-        # Chat/Special chat messages (cmd=93101 or 93102)
-        # Body contains a list of messages
-        if cmd in (93101, 93102):
-            if not body or not isinstance(body, list):
-                return
-
-            for message_data in body:
-                try:
-                    # Determine message type from msgTypeCode or messageTypeCode
-                    msg_type = (
-                        message_data.get("msgTypeCode") or
-                        message_data.get("messageTypeCode") or
-                        1  # Default to TEXT
-                    )
+        body = msg.get("bdy")
+        if not body or not isinstance(body, list):
+            return
 
-                    # Handle chat message (type=1: TEXT)
-                    if msg_type == 1:
-                        chat_message = ChatMessage.from_raw(message_data)
-                        await self._dispatch_event("on_chat", chat_message)
+        for message_data in body:
+            msg_type = None
+            try:
+                # Determine message type from msgTypeCode or messageTypeCode
+                msg_type = (
+                    message_data.get("msgTypeCode") or
+                    message_data.get("messageTypeCode") or
+                    1  # Default to TEXT
+                )
 
-                    # Handle donation message (type=10: DONATION)
-                    elif msg_type == 10:
-                        donation_message = DonationMessage.from_raw(message_data)
-                        await self._dispatch_event("on_donation", donation_message)
+                handler = _MESSAGE_HANDLERS.get(msg_type)
+                if handler is None:
+                    logger.debug("Unhandled message type: %s", msg_type)
+                    continue
 
-                    else:
-                        logger.debug(f"Unhandled message type: {msg_type}")
+                event_name, parse = handler
+                await self._dispatch_event(event_name, parse(message_data))
 
-                except Exception as e:
-                    logger.error(
-                        f"Error parsing message (cmd={cmd}, type={msg_type}): {e}",
-                        exc_info=True
-                    )
-
-        else:
-            logger.debug(f"Received message with cmd={cmd}")
+            except Exception as e:
+                logger.error(
+                    f"Error parsing message (cmd={cmd}, type={msg_type}): {e}",
+                    exc_info=True
+                )
 
     async def start(self) -> None:
         """
@@ -186,6 +191,7 @@ class ChzzkChatClient:
             MaxReconnectAttemptsError: If max reconnection attempts exceeded
         """
         self._running = True
+        self._reconnection_manager.reset()
         logger.info("Starting chat client...")
 
         while self._running:
@@ -226,6 +232,8 @@ class ChzzkChatClient:
 
                 # Attempt reconnection
                 if not await self._reconnection_manager.wait_before_reconnect():
+                    if not self._running:
+                        break
                     raise MaxReconnectAttemptsError(
                         f"Failed to reconnect after {self._reconnection_manager.attempts} attempts"
                     )
@@ -240,6 +248,8 @@ class ChzzkChatClient:
                 self._total_errors += 1
                 # For unexpected errors, try to reconnect
                 if not await self._reconnection_manager.wait_before_reconnect():
+                    if not self._running:
+                        break
                     raise MaxReconnectAttemptsError(
                         f"Failed to reconnect after {self._reconnection_manager.attempts} attempts"
                     )
@@ -250,6 +260,7 @@ class ChzzkChatClient:
         """Stop the chat client."""
         logger.info("Stopping chat client...")
         self._running = False
+        self._reconnection_manager.cancel()
 
         if self._websocket:
             await self._websocket.close()
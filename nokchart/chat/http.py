@@ -3,6 +3,9 @@ HTTP API for obtaining access tokens and chat channel IDs.
 """
 
 import aiohttp
+import asyncio
+import orjson
+import time
 from typing import Optional, Dict, Any
 import logging
 
@@ -10,13 +13,56 @@ from nokchart.chat.exceptions import ChannelNotFoundError, AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# Shared session so keep-alive connections and DNS results are pooled across
+# API calls and WebSocket reconnects instead of paying a TCP+TLS handshake on
+# every request
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
 
-async def get_live_status(channel_id: str) -> Optional[Dict[str, Any]]:
+# How long a fetched live status may be reused by get_chat_channel_id, so a
+# quick reconnect doesn't repeat the request the watcher just made
+STATUS_CACHE_TTL = 5.0
+
+# channel_id -> (monotonic fetch time, live status content)
+_status_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it if needed.
+
+    The pool is unbounded because chat WebSockets hold their connection for
+    the whole stream; a cap would block API calls once enough channels are live.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+        _session_loop = loop
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+    _session = None
+    _session_loop = None
+
+
+async def get_live_status(channel_id: str, max_age: float = 0.0) -> Optional[Dict[str, Any]]:
     """
     Get the full live status for a channel.
 
     Args:
         channel_id: The Chzzk channel ID
+        max_age: Reuse a status fetched within this many seconds (0 = always fetch)
 
     Returns:
         Live status dictionary if available, None otherwise
@@ -24,29 +70,36 @@ async def get_live_status(channel_id: str) -> Optional[Dict[str, Any]]:
     Raises:
         ChannelNotFoundError: If the channel doesn't exist or API error
     """
+    if max_age > 0:
+        cached = _status_cache.get(channel_id)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
     url = f"https://api.chzzk.naver.com/polling/v2/channels/{channel_id}/live-status"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise ChannelNotFoundError(
-                        f"Failed to get channel status: HTTP {response.status}"
-                    )
+        session = await _get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ChannelNotFoundError(
+                    f"Failed to get channel status: HTTP {response.status}"
+                )
 
-                data = await response.json()
+            data = await response.json(loads=orjson.loads)
 
-                if data.get("code") != 200:
-                    raise ChannelNotFoundError(
-                        f"API error: {data.get('message', 'Unknown error')}"
-                    )
+            if data.get("code") != 200:
+                raise ChannelNotFoundError(
+                    f"API error: {data.get('message', 'Unknown error')}"
+                )
 
-                content = data.get("content")
-                if not content:
-                    logger.warning(f"No content in live status for channel {channel_id}")
-                    return None
+            content = data.get("content")
+            if not content:
+                logger.warning(f"No content in live status for channel {channel_id}")
+                _status_cache.pop(channel_id, None)
+                return None
 
-                return content
+            _status_cache[channel_id] = (time.monotonic(), content)
+            return content
 
     except aiohttp.ClientError as e:
         raise ChannelNotFoundError(f"Network error: {e}")
@@ -56,6 +109,9 @@ async def get_chat_channel_id(channel_id: str) -> Optional[str]:
     """
     Get the chat channel ID for a live stream.
 
+    Uses the live status endpoint, reusing a status fetched within the last
+    STATUS_CACHE_TTL seconds.
+
     Args:
         channel_id: The Chzzk channel ID
 
@@ -65,35 +121,15 @@ async def get_chat_channel_id(channel_id: str) -> Optional[str]:
     Raises:
         ChannelNotFoundError: If the channel doesn't exist or API error
     """
-    url = f"https://api.chzzk.naver.com/polling/v2/channels/{channel_id}/live-status"
-
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise ChannelNotFoundError(
-                        f"Failed to get channel status: HTTP {response.status}"
-                    )
+    content = await get_live_status(channel_id, max_age=STATUS_CACHE_TTL)
+    chat_channel_id = content.get("chatChannelId") if content else None
 
-                data = await response.json()
+    if chat_channel_id:
+        logger.info(f"Got chat channel ID: {chat_channel_id}")
+    else:
+        logger.warning(f"Channel {channel_id} is not live")
 
-                if data.get("code") != 200:
-                    raise ChannelNotFoundError(
-                        f"API error: {data.get('message', 'Unknown error')}"
-                    )
-
-                content = data.get("content", {})
-                chat_channel_id = content.get("chatChannelId")
-
-                if chat_channel_id:
-                    logger.info(f"Got chat channel ID: {chat_channel_id}")
-                else:
-                    logger.warning(f"Channel {channel_id} is not live")
-
-                return chat_channel_id
-
-    except aiohttp.ClientError as e:
-        raise ChannelNotFoundError(f"Network error: {e}")
+    return chat_channel_id
 
 
 async def get_access_token(chat_channel_id: str) -> str:
@@ -116,28 +152,28 @@ async def get_access_token(chat_channel_id: str) -> str:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise AuthenticationError(
-                        f"Failed to get access token: HTTP {response.status}"
-                    )
+        session = await _get_session()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                raise AuthenticationError(
+                    f"Failed to get access token: HTTP {response.status}"
+                )
 
-                data = await response.json()
+            data = await response.json(loads=orjson.loads)
 
-                if data.get("code") != 200:
-                    raise AuthenticationError(
-                        f"API error: {data.get('message', 'Unknown error')}"
-                    )
+            if data.get("code") != 200:
+                raise AuthenticationError(
+                    f"API error: {data.get('message', 'Unknown error')}"
+                )
 
-                content = data.get("content", {})
-                access_token = content.get("accessToken")
+            content = data.get("content", {})
+            access_token = content.get("accessToken")
 
-                if not access_token:
-                    raise AuthenticationError("No access token in response")
+            if not access_token:
+                raise AuthenticationError("No access token in response")
 
-                logger.info("Successfully obtained access token")
-                return access_token
+            logger.info("Successfully obtained access token")
+            return access_token
 
     except aiohttp.ClientError as e:
         raise AuthenticationError(f"Network error: {e}")
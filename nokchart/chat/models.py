@@ -2,17 +2,35 @@
 Message models for Chzzk chat.
 """
 
-import json
+from functools import lru_cache
 from typing import Optional, Any, Dict
 from dataclasses import dataclass
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Amount might be in different fields depending on donation type (in priority order)
+_AMOUNT_FIELDS = ("payAmount", "donationAmount", "amount")
+
+
+def _pick_amount(extras: Dict[str, Any]) -> Any:
+    """Return the first truthy amount field, like chaining ``or`` over the fields."""
+    value = None
+    for field in _AMOUNT_FIELDS:
+        value = extras.get(field)
+        if value:
+            break
+    return value
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserProfile:
-    """User profile information."""
+    """User profile information.
+
+    Instances are cached and shared between messages, so they are immutable.
+    """
     nickname: str
     user_id_hash: str
     badge: Optional[str] = None
@@ -25,6 +43,9 @@ class UserProfile:
         """
         Parse UserProfile from JSON string.
 
+        Chat is dominated by repeat users sending the same profile blob, so
+        parsed profiles are memoized by the raw string.
+
         Args:
             json_str: JSON string or None
 
@@ -35,52 +56,62 @@ class UserProfile:
             return None
 
         try:
-            data = json.loads(json_str)
-
-            # Handle empty object
-            if not data or data == {}:
-                return None
-
-            # Extract required fields
-            nickname = data.get("nickname", "Unknown")
-            user_id_hash = data.get("userIdHash", "")
-
-            # Extract optional fields
-            badge = None
-            if "badge" in data and data["badge"]:
-                badge_data = data["badge"]
-                if isinstance(badge_data, dict):
-                    badge = badge_data.get("imageUrl")
-
-            title = None
-            if "title" in data and data["title"]:
-                title_data = data["title"]
-                if isinstance(title_data, dict):
-                    title = title_data.get("name")
-
-            verified_mark = data.get("verifiedMark", False)
-
-            activity_badge = None
-            if "activityBadges" in data and data["activityBadges"]:
-                activity_badges = data["activityBadges"]
-                if isinstance(activity_badges, list) and len(activity_badges) > 0:
-                    activity_badge = activity_badges[0]
-
-            return cls(
-                nickname=nickname,
-                user_id_hash=user_id_hash,
-                badge=badge,
-                title=title,
-                verified_mark=verified_mark,
-                activity_badge=activity_badge,
-            )
-
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return _parse_profile(json_str)
+        except TypeError as e:  # Unhashable, i.e. not a JSON string
             logger.warning(f"Failed to parse profile JSON: {e}")
             return None
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_profile(json_str: str) -> Optional[UserProfile]:
+    """Parse a non-empty profile JSON string (cached)."""
+    try:
+        data = orjson.loads(json_str)
+
+        # Handle empty object
+        if not data or data == {}:
+            return None
+
+        # Extract required fields
+        nickname = data.get("nickname", "Unknown")
+        user_id_hash = data.get("userIdHash", "")
+
+        # Extract optional fields
+        badge = None
+        if "badge" in data and data["badge"]:
+            badge_data = data["badge"]
+            if isinstance(badge_data, dict):
+                badge = badge_data.get("imageUrl")
+
+        title = None
+        if "title" in data and data["title"]:
+            title_data = data["title"]
+            if isinstance(title_data, dict):
+                title = title_data.get("name")
+
+        verified_mark = data.get("verifiedMark", False)
+
+        activity_badge = None
+        if "activityBadges" in data and data["activityBadges"]:
+            activity_badges = data["activityBadges"]
+            if isinstance(activity_badges, list) and len(activity_badges) > 0:
+                activity_badge = activity_badges[0]
+
+        return UserProfile(
+            nickname=nickname,
+            user_id_hash=user_id_hash,
+            badge=badge,
+            title=title,
+            verified_mark=verified_mark,
+            activity_badge=activity_badge,
+        )
+
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning(f"Failed to parse profile JSON: {e}")
+        return None
+
+
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a chat message."""
     msg_id: str
@@ -118,8 +149,8 @@ class ChatMessage:
         extras_json = data.get("extras")
         if extras_json and extras_json != "{}":
             try:
-                extras = json.loads(extras_json)
-            except (json.JSONDecodeError, TypeError) as e:
+                extras = orjson.loads(extras_json)
+            except (orjson.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to parse extras JSON: {e}")
 
         return cls(
@@ -131,7 +162,7 @@ class ChatMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DonationMessage:
     """Represents a donation/subscription message."""
     msg_id: str
@@ -174,20 +205,15 @@ class DonationMessage:
         extras_json = data.get("extras")
         if extras_json and extras_json != "{}":
             try:
-                extras = json.loads(extras_json)
+                extras = orjson.loads(extras_json)
 
                 # Extract donation type and amount from extras
                 if isinstance(extras, dict):
                     donation_type = extras.get("donationType", "unknown")
 
-                    # Amount might be in different fields depending on donation type
-                    amount = (
-                        extras.get("payAmount") or
-                        extras.get("donationAmount") or
-                        extras.get("amount")
-                    )
+                    amount = _pick_amount(extras)
 
-            except (json.JSONDecodeError, TypeError) as e:
+            except (orjson.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to parse donation extras JSON: {e}")
 
         return cls(
@@ -4,6 +4,8 @@ Reconnection manager with exponential backoff.
 
 import asyncio
 import logging
+import random
+from typing import Literal
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,7 @@ class ReconnectionManager:
 
     Implements the strategy:
     - 1s → 2s → 4s → 8s → 16s → 32s → 60s (max)
+    - Jitter the actual wait so many clients don't reconnect in lockstep
     - Reset counter on successful connection
     """
 
@@ -22,6 +25,7 @@ class ReconnectionManager:
         initial_backoff: float = 1.0,
         max_backoff: float = 60.0,
         max_attempts: int = 10,
+        jitter: Literal["none", "full", "equal"] = "full",
     ):
         """
         Initialize reconnection manager.
@@ -30,24 +34,32 @@ class ReconnectionManager:
             initial_backoff: Initial backoff time in seconds
             max_backoff: Maximum backoff time in seconds
             max_attempts: Maximum number of reconnection attempts (0 = unlimited)
+            jitter: "full" waits uniform(0, backoff), "equal" waits
+                uniform(backoff/2, backoff), "none" waits exactly backoff
         """
         self._initial_backoff = initial_backoff
         self._max_backoff = max_backoff
         self._max_attempts = max_attempts
+        self._jitter = jitter
 
         self._attempts = 0
-        self._current_backoff = initial_backoff
+
+        # Set by cancel() to cut a pending backoff wait short
+        self._cancelled = asyncio.Event()
 
     async def wait_before_reconnect(self) -> bool:
         """
         Wait before attempting reconnection with exponential backoff.
 
         Returns:
-            True if should retry, False if max attempts exceeded
+            True if should retry, False if max attempts exceeded or cancelled
 
         Raises:
             Never - returns False instead
         """
+        if self._cancelled.is_set():
+            return False
+
         self._attempts += 1
 
         # Check if max attempts exceeded
@@ -57,23 +69,37 @@ class ReconnectionManager:
             )
             return False
 
+        delay = self._backoff(self._attempts)
+        if self._jitter == "full":
+            delay = random.uniform(0, delay)
+        elif self._jitter == "equal":
+            delay = random.uniform(delay / 2, delay)
+
         logger.info(
             f"Reconnection attempt {self._attempts}"
             + (f"/{self._max_attempts}" if self._max_attempts > 0 else "")
-            + f" in {self._current_backoff:.1f}s"
+            + f" in {delay:.1f}s"
         )
 
-        # Wait with current backoff
-        await asyncio.sleep(self._current_backoff)
-
-        # Increase backoff for next attempt (exponential)
-        self._current_backoff = min(
-            self._current_backoff * 2.0,
-            self._max_backoff,
-        )
+        # Wait with current backoff, returning early if cancelled
+        try:
+            await asyncio.wait_for(self._cancelled.wait(), timeout=delay)
+            logger.info("Reconnection cancelled")
+            return False
+        except asyncio.TimeoutError:
+            pass
 
         return True
 
+    def _backoff(self, attempt: int) -> float:
+        """Backoff before the given attempt (1-based): initial * 2^(attempt-1), capped."""
+        # Bound the shift so unlimited attempts can't overflow the float conversion
+        return min(self._initial_backoff * (1 << min(attempt - 1, 32)), self._max_backoff)
+
+    def cancel(self) -> None:
+        """Abort any pending and future backoff waits (e.g. on shutdown)."""
+        self._cancelled.set()
+
     def reset(self) -> None:
         """Reset reconnection state after successful connection."""
         if self._attempts > 0:
@@ -83,7 +109,7 @@ class ReconnectionManager:
             )
 
         self._attempts = 0
-        self._current_backoff = self._initial_backoff
+        self._cancelled.clear()
 
     @property
     def attempts(self) -> int:
@@ -92,5 +118,5 @@ class ReconnectionManager:
 
     @property
     def current_backoff(self) -> float:
-        """Get the current backoff time."""
-        return self._current_backoff
+        """Get the backoff time before the next attempt (upper bound when jittered)."""
+        return self._backoff(self._attempts + 1)
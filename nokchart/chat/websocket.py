@@ -4,10 +4,13 @@ WebSocket connection management for Chzzk chat.
 
 import aiohttp
 import asyncio
-import json
 import logging
+from functools import lru_cache
 from typing import Optional, AsyncIterator, Dict, Any
 
+import orjson
+
+from nokchart.chat.http import _get_session
 from nokchart.chat.exceptions import (
     ConnectionError as ChzzkConnectionError,
     ConnectionLostError,
@@ -17,6 +20,44 @@ from nokchart.chat.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Add headers to appear more like a real browser
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Origin": "https://chzzk.naver.com",
+    "Referer": "https://chzzk.naver.com/",
+}
+
+# CONNECT message (cmd=100) with only the access token and chat channel ID
+# left to fill in, as JSON-encoded strings
+_CONNECT_TEMPLATE = (
+    '{"bdy":{"accTkn":%s,"auth":"READ","devType":2001,"uid":null},'
+    '"cid":%s,"cmd":100,"tid":1,"svcid":"game","ver":"2"}'
+)
+
+# Heartbeat payloads, encoded up front
+_PING_TEMPLATE = '{"cmd":0,"tid":%d}'
+_PONG_PAYLOAD = '{"cmd":10000}'
+
+# Frame types checked for every received message
+_WS_TEXT = aiohttp.WSMsgType.TEXT
+_WS_BINARY = aiohttp.WSMsgType.BINARY
+_WS_CLOSED = aiohttp.WSMsgType.CLOSED
+_WS_ERROR = aiohttp.WSMsgType.ERROR
+
+# Send a PING this long after the last heartbeat, then expect PONG within PONG_TIMEOUT
+HEARTBEAT_INTERVAL = 58.0
+PONG_TIMEOUT = 3.0
+
+
+@lru_cache(maxsize=256)
+def _server_url(channel_id: str) -> tuple[int, str]:
+    """Select the chat server for a channel (same algorithm as chzzkpy).
+
+    Cached so reconnects to the same channel skip the computation.
+    """
+    server_id = (sum(map(ord, channel_id)) % 9) + 1
+    return server_id, f"wss://kr-ss{server_id}.chat.naver.com/chat"
+
 
 class ChzzkWebSocket:
     """
@@ -36,6 +77,12 @@ class ChzzkWebSocket:
         self._session_id = session_id
         self._tid = 1
         self._closed = False
+        # Set once close() has finished, so concurrent callers can wait for it
+        self._close_done = asyncio.Event()
+
+        # Heartbeat deadlines on the event loop clock (set by poll_events)
+        self._ping_at = 0.0
+        self._pong_deadline: Optional[float] = None
 
     @classmethod
     async def connect(
@@ -61,23 +108,16 @@ class ChzzkWebSocket:
             ConnectionError: If connection or handshake fails
             AuthenticationError: If authentication fails
         """
-        # Select server using the same algorithm as chzzkpy
-        server_id = (sum(ord(c) for c in channel_id) % 9) + 1
-        url = f"wss://kr-ss{server_id}.chat.naver.com/chat"
+        server_id, url = _server_url(channel_id)
 
         logger.info(f"Connecting to {url} (server_id={server_id})")
 
         try:
-            # Add headers to appear more like a real browser
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Origin": "https://chzzk.naver.com",
-                "Referer": "https://chzzk.naver.com/",
-            }
-
-            session = aiohttp.ClientSession()
+            session = await _get_session()
+            # ws_connect only takes receive/close timeouts, so bound the
+            # opening handshake here
             ws = await asyncio.wait_for(
-                session.ws_connect(url, headers=headers, heartbeat=30.0),
+                session.ws_connect(url, headers=_HEADERS, heartbeat=30.0),
                 timeout=timeout,
             )
 
@@ -87,32 +127,17 @@ class ChzzkWebSocket:
                 channel_id=channel_id,
                 chat_channel_id=chat_channel_id,
             )
-            instance._session = session  # Store session for cleanup
 
             # Send CONNECT message
-            connect_msg = {
-                "bdy": {
-                    "accTkn": access_token,
-                    "auth": "READ",
-                    "devType": 2001,
-                    "uid": None,
-                },
-                "cid": chat_channel_id,
-                "cmd": 100,
-                "tid": 1,
-                "svcid": "game",
-                "ver": "2",
-            }
-
-            await instance._send(connect_msg)
-            logger.debug(f"Sent CONNECT message: {connect_msg}")
+            await instance._send_str(
+                _CONNECT_TEMPLATE
+                % (orjson.dumps(access_token).decode(), orjson.dumps(chat_channel_id).decode())
+            )
+            logger.debug("Sent CONNECT message (cid=%s)", chat_channel_id)
 
             # Wait for CONNECTED response (cmd=10100)
             try:
-                response = await asyncio.wait_for(
-                    ws.receive_json(),
-                    timeout=timeout,
-                )
+                response = await ws.receive_json(loads=orjson.loads, timeout=timeout)
 
                 if response.get("cmd") == 10100:
                     body = response.get("bdy", {})
@@ -133,21 +158,38 @@ class ChzzkWebSocket:
         except asyncio.TimeoutError:
             raise ChzzkConnectionError("Connection timeout")
 
-    async def _send(self, data: Dict[str, Any]) -> None:
-        """Send JSON message to WebSocket."""
+    async def _send_str(self, payload: str) -> None:
+        """Send an already-encoded JSON message to WebSocket."""
         try:
-            await self._ws.send_json(data)
+            await self._ws.send_str(payload)
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             raise ConnectionLostError(f"Failed to send message: {e}")
 
     async def _send_ping(self) -> None:
         """Send PING message (cmd=0)."""
-        ping_msg = {"cmd": 0, "tid": self._tid}
+        ping_msg = _PING_TEMPLATE % self._tid
         self._tid += 1
-        await self._send(ping_msg)
+        await self._send_str(ping_msg)
         logger.debug("Sent PING")
 
+    async def _on_pong(self) -> None:
+        """Handle PONG (cmd=10000) - schedule the next heartbeat."""
+        logger.debug("Received PONG")
+        self._pong_deadline = None
+        self._ping_at = asyncio.get_running_loop().time() + HEARTBEAT_INTERVAL
+
+    async def _on_ping(self) -> None:
+        """Handle PING (cmd=0) - respond with PONG."""
+        logger.debug("Received PING, sending PONG")
+        await self._send_str(_PONG_PAYLOAD)
+
+    # Control frames consumed by poll_events: cmd -> handler
+    _CONTROL_HANDLERS = {
+        10000: _on_pong,
+        0: _on_ping,
+    }
+
     async def receive_message(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Receive a single message from WebSocket.
@@ -166,35 +208,44 @@ class ChzzkWebSocket:
             return None
 
         try:
-            if timeout:
-                msg = await asyncio.wait_for(self._ws.receive(), timeout=timeout)
-            else:
-                msg = await self._ws.receive()
-
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                return json.loads(msg.data)
-            elif msg.type == aiohttp.WSMsgType.CLOSED:
-                logger.warning("WebSocket closed by server")
-                raise ConnectionLostError("WebSocket closed by server")
-            elif msg.type == aiohttp.WSMsgType.ERROR:
-                logger.error(f"WebSocket error: {self._ws.exception()}")
-                raise ConnectionLostError(f"WebSocket error: {self._ws.exception()}")
-            else:
-                logger.warning(f"Unexpected message type: {msg.type}")
-                return None
-
-        except asyncio.TimeoutError:
+            # aiohttp applies the timeout inline, without wrapping the read in a task
+            return self._decode(await self._ws.receive(timeout=timeout))
+        except (asyncio.TimeoutError, ConnectionLostError):
             raise
         except Exception as e:
             logger.error(f"Error receiving message: {e}")
             raise ConnectionLostError(f"Error receiving message: {e}")
 
+    def _decode(self, msg: aiohttp.WSMessage) -> Optional[Dict[str, Any]]:
+        """
+        Decode a raw WebSocket frame.
+
+        Returns:
+            Parsed JSON message, or None for frames without a payload
+
+        Raises:
+            ConnectionLostError: If the frame reports a closed or failed connection
+        """
+        msg_type = msg.type
+        if msg_type == _WS_TEXT or msg_type == _WS_BINARY:
+            return orjson.loads(msg.data)
+        elif msg_type == _WS_CLOSED:
+            logger.warning("WebSocket closed by server")
+            raise ConnectionLostError("WebSocket closed by server")
+        elif msg_type == _WS_ERROR:
+            logger.error(f"WebSocket error: {self._ws.exception()}")
+            raise ConnectionLostError(f"WebSocket error: {self._ws.exception()}")
+        else:
+            logger.warning(f"Unexpected message type: {msg_type}")
+            return None
+
     async def poll_events(self) -> AsyncIterator[Dict[str, Any]]:
         """
         Poll for events with heartbeat monitoring.
 
-        This will be implemented in Phase 3 with proper heartbeat logic.
-        For now, this is a placeholder that yields messages.
+        A PING is sent every HEARTBEAT_INTERVAL seconds (counted from the last
+        PONG) and the connection is considered dead if no PONG arrives within
+        PONG_TIMEOUT. Messages keep flowing while a PONG is outstanding.
 
         Yields:
             Parsed message dictionaries
@@ -203,50 +254,100 @@ class ChzzkWebSocket:
             ConnectionLostError: If connection is lost
             HeartbeatTimeoutError: If heartbeat timeout occurs
         """
-        while not self._closed:
-            try:
-                # Phase 3 will add proper heartbeat with 58-second timeout
-                msg = await self.receive_message(timeout=58.0)
+        loop = asyncio.get_running_loop()
+        self._ping_at = loop.time() + HEARTBEAT_INTERVAL
+        self._pong_deadline = None
 
-                if msg is None:
+        while not self._closed:
+            deadline = self._pong_deadline if self._pong_deadline is not None else self._ping_at
+            remaining = deadline - loop.time()
+
+            if remaining <= 0:
+                if self._pong_deadline is not None:
+                    # The loop may have stalled past the deadline with the
+                    # PONG already received, so check buffered frames first
+                    for msg in await self._read_buffered():
+                        yield msg
+                    if self._pong_deadline is not None:
+                        raise HeartbeatTimeoutError(
+                            f"No PONG response within {PONG_TIMEOUT:g} seconds"
+                        )
                     continue
 
-                cmd = msg.get("cmd")
+                logger.debug("Heartbeat interval elapsed, sending PING")
+                await self._send_ping()
+                self._pong_deadline = loop.time() + PONG_TIMEOUT
+                continue
 
-                # Handle PONG (cmd=10000)
-                if cmd == 10000:
-                    logger.debug("Received PONG")
-                    continue
+            # Read frames directly rather than through receive_message to keep
+            # one coroutine per frame on the hot path
+            try:
+                msg = self._decode(await self._ws.receive(timeout=remaining))
+            except asyncio.TimeoutError:
+                # Deadline reached; handled at the top of the loop
+                continue
+            except ConnectionLostError:
+                raise
+            except Exception as e:
+                logger.error(f"Error receiving message: {e}")
+                raise ConnectionLostError(f"Error receiving message: {e}")
+
+            if msg is None:
+                continue
+
+            handler = self._CONTROL_HANDLERS.get(msg.get("cmd"))
+            if handler is not None:
+                await handler(self)
+                continue
+
+            # Yield other messages
+            yield msg
+
+    async def _read_buffered(self) -> list[Dict[str, Any]]:
+        """
+        Read the frames already received without waiting for more.
 
-                # Handle PING (cmd=0) - respond with PONG
-                elif cmd == 0:
-                    logger.debug("Received PING, sending PONG")
-                    await self._send({"cmd": 10000})
-                    continue
+        Control frames are handled as in poll_events.
 
-                # Yield other messages
-                else:
-                    yield msg
+        Returns:
+            Parsed non-control messages, in arrival order
 
+        Raises:
+            ConnectionLostError: If connection is lost
+        """
+        messages = []
+        while True:
+            try:
+                # A zero timeout only fires if receive() has to wait, so
+                # buffered frames are still returned
+                async with asyncio.timeout(0):
+                    msg = self._decode(await self._ws.receive())
             except asyncio.TimeoutError:
-                # Phase 3: This will trigger PING/PONG exchange
-                logger.debug("Timeout waiting for message (heartbeat)")
-                await self._send_ping()
-
-                # Wait for PONG with 3-second timeout
-                try:
-                    pong_msg = await self.receive_message(timeout=3.0)
-                    if pong_msg and pong_msg.get("cmd") == 10000:
-                        logger.debug("Received PONG after timeout")
-                        continue
-                    else:
-                        raise HeartbeatTimeoutError("No PONG response")
-                except asyncio.TimeoutError:
-                    raise HeartbeatTimeoutError("No PONG response within 3 seconds")
+                return messages
+            except ConnectionLostError:
+                raise
+            except Exception as e:
+                logger.error(f"Error receiving message: {e}")
+                raise ConnectionLostError(f"Error receiving message: {e}")
+
+            if msg is None:
+                continue
+
+            handler = self._CONTROL_HANDLERS.get(msg.get("cmd"))
+            if handler is not None:
+                await handler(self)
+            else:
+                messages.append(msg)
 
     async def close(self) -> None:
-        """Close the WebSocket connection."""
+        """Close the WebSocket connection.
+
+        Safe to call repeatedly or concurrently; only the first call closes the
+        socket and the others wait for it to finish.
+        """
         if self._closed:
+            if not self._close_done.is_set():
+                await self._close_done.wait()
             return
 
         self._closed = True
@@ -256,12 +357,8 @@ class ChzzkWebSocket:
                 await self._ws.close()
         except Exception as e:
             logger.warning(f"Error closing WebSocket: {e}")
-
-        try:
-            if hasattr(self, "_session"):
-                await self._session.close()
-        except Exception as e:
-            logger.warning(f"Error closing session: {e}")
+        finally:
+            self._close_done.set()
 
         logger.info("WebSocket connection closed")
 
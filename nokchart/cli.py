@@ -1,19 +1,30 @@
 """Command-line interface for NokChart."""
 
-import asyncio
-import json
 import logging
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional
 
 import click
+import orjson
 
-from nokchart.aggregation import Aggregator
-from nokchart.config import load_channels, load_channel_names, load_config
-from nokchart.peak_detection import PeakDetector
-from nokchart.topic_analysis import TopicAnalyzer, TopicsOutput
-from nokchart.visualization import ChartGenerator
-from nokchart.watcher import Watcher
+KST = timezone(timedelta(hours=9))
+
+# First "type" field of a serialized Event. The top-level type precedes the
+# nested raw payload in the field order, and quotes inside string values are
+# escaped, so the first match is always the event's own type.
+_EVENT_TYPE_RE = re.compile(rb'"type":\s*"([a-z_]+)"')
+
+# Per-stream cache of the stats scan, written next to events.jsonl
+STATS_CACHE_FILE = "stats_cache.json"
+
+# Fields of a stats scan, also written to collection_report.json by the collector
+_SCAN_KEYS = ("chat_count", "donation_count", "first_received_at", "last_received_at")
 
 # Configure logging
 logging.basicConfig(
@@ -46,6 +57,11 @@ def cli():
 )
 def watch(channels: Path, config: Path):
     """Watch channels and automatically collect chat events when streams go live."""
+    import asyncio
+
+    from nokchart.config import load_channels, load_channel_names, load_config
+    from nokchart.watcher import Watcher
+
     logger.info("Starting NokChart watcher")
 
     # Load configuration
@@ -59,6 +75,15 @@ def watch(channels: Path, config: Path):
 
     logger.info(f"Monitoring {len(channel_ids)} channels: {channel_ids}")
 
+    # Use uvloop's faster event loop for the socket fan-in when it is installed
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     # Create and start watcher
     watcher = Watcher(channel_ids=channel_ids, config=cfg, channel_names=channel_names)
 
@@ -69,6 +94,19 @@ def watch(channels: Path, config: Path):
         asyncio.run(watcher.stop())
 
 
+def _parse_buckets(ctx: click.Context, param: click.Parameter, value: str) -> tuple[int, ...]:
+    """Parse and validate comma-separated bucket sizes before any work starts."""
+    try:
+        sizes = tuple(int(b) for b in value.split(","))
+    except ValueError:
+        raise click.BadParameter(f"expected comma-separated integers, got {value!r}")
+
+    if any(size <= 0 for size in sizes):
+        raise click.BadParameter("bucket sizes must be positive")
+
+    return sizes
+
+
 @cli.command()
 @click.option("--channel", required=True, help="Channel ID to collect from")
 @click.option(
@@ -111,6 +149,7 @@ def collect(channel: str, out: Path, config: Path):
 @click.option(
     "--buckets",
     default="1,5,60",
+    callback=_parse_buckets,
     help="Comma-separated bucket sizes in seconds",
 )
 @click.option(
@@ -119,12 +158,11 @@ def collect(channel: str, out: Path, config: Path):
     default=10,
     help="Rolling average window in seconds",
 )
-def build_ts(events: Path, out: Path, buckets: str, rolling: int):
+def build_ts(events: Path, out: Path, buckets: tuple[int, ...], rolling: int):
     """Build time series from events.jsonl file."""
-    logger.info(f"Building time series from {events}")
+    from nokchart.aggregation import Aggregator
 
-    # Parse bucket sizes
-    bucket_sizes = [int(b.strip()) for b in buckets.split(",")]
+    logger.info(f"Building time series from {events}")
 
     # Default output to same directory as events
     if out is None:
@@ -136,7 +174,7 @@ def build_ts(events: Path, out: Path, buckets: str, rolling: int):
     aggregator = Aggregator(events)
     output_files = aggregator.build_time_series(
         output_dir=out,
-        bucket_sizes=bucket_sizes,
+        bucket_sizes=list(buckets),
         rolling_window=rolling,
     )
 
@@ -197,6 +235,8 @@ def build_ts(events: Path, out: Path, buckets: str, rolling: int):
 )
 def peaks(ts: Path, stream_id: str, out: Path, window: int, topk: int, min_gap: int, events_file: Path):
     """Detect peaks in chat activity time series."""
+    from nokchart.peak_detection import PeakDetector
+
     logger.info(f"Detecting peaks in {ts}")
 
     # Default output path
@@ -276,6 +316,8 @@ def peaks(ts: Path, stream_id: str, out: Path, window: int, topk: int, min_gap:
 )
 def topics(events: Path, stream_id: str, out: Path, segment: int, topk: int, min_freq: int):
     """Extract topic keywords from chat segments."""
+    from nokchart.topic_analysis import TopicAnalyzer
+
     logger.info(f"Analyzing topics from {events}")
 
     # Default output path
@@ -287,8 +329,8 @@ def topics(events: Path, stream_id: str, out: Path, segment: int, topk: int, min
     topics_output = analyzer.analyze_events_file(events, stream_id)
 
     # Save topics
-    with open(out, "w", encoding="utf-8") as f:
-        f.write(topics_output.model_dump_json(indent=2))
+    with open(out, "wb") as f:
+        f.write(orjson.dumps(topics_output.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
 
     click.echo(f"\nTopics saved to: {out}")
     click.echo(f"\nSegments analyzed: {len(topics_output.segments)}")
@@ -330,27 +372,26 @@ def topics(events: Path, stream_id: str, out: Path, segment: int, topk: int, min
 )
 def plot(ts: Path, peaks: Path, topics_file: Path, out: Path, title: str):
     """Generate chat activity chart with optional topics track."""
+    from nokchart.models import PeaksOutput
+    from nokchart.topic_analysis import TopicsOutput
+    from nokchart.visualization import ChartGenerator
+
     logger.info(f"Plotting chart from {ts}")
 
     # Default output path
     if out is None:
         out = ts.parent / "chart_chat_rate.png"
 
-    # Load peaks if provided
+    # Load peaks if provided. model_validate_json parses and validates in
+    # pydantic's core without building an intermediate dict.
     peaks_data = None
     if peaks:
-        with open(peaks) as f:
-            peaks_dict = json.load(f)
-            from nokchart.models import PeaksOutput
-
-            peaks_data = PeaksOutput(**peaks_dict)
+        peaks_data = PeaksOutput.model_validate_json(peaks.read_bytes())
 
     # Load topics if provided
     topics_data = None
     if topics_file:
-        with open(topics_file, encoding="utf-8") as f:
-            topics_dict = json.load(f)
-            topics_data = TopicsOutput(**topics_dict)
+        topics_data = TopicsOutput.model_validate_json(topics_file.read_bytes())
 
     # Generate chart
     generator = ChartGenerator(ts)
@@ -364,6 +405,192 @@ def plot(ts: Path, peaks: Path, topics_file: Path, out: Path, title: str):
     click.echo(f"Chart saved to: {out}")
 
 
+def _list_subdirs(path: Path) -> list[Path]:
+    """List subdirectories of path in sorted order.
+
+    Uses os.scandir so the entry type from the directory listing is reused
+    instead of a separate stat per entry.
+    """
+    with os.scandir(path) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.is_dir())
+
+
+def _edge_lines(mm: mmap.mmap) -> tuple[Optional[bytes], Optional[bytes]]:
+    """Return the first and last non-blank lines of a mapped file.
+
+    The last line is found by searching backwards from the end, so neither
+    lookup depends on the file size.
+    """
+    first_line = None
+    mm.seek(0)
+    for line in iter(mm.readline, b''):
+        if line.strip():
+            first_line = line
+            break
+
+    if first_line is None:
+        return None, None
+
+    # Skip trailing newlines and blank lines, then back up to the line start
+    end = len(mm)
+    while end and mm[end - 1] in b' \t\r\n':
+        end -= 1
+    start = mm.rfind(b'\n', 0, end) + 1
+    return first_line, mm[start:end]
+
+
+def _scan_events(events_file: Path) -> Optional[dict]:
+    """Count chat/donation events and read the first and last receive times.
+
+    Returns:
+        Scan result, or None if the file has no events
+    """
+    # Only the first and last events are fully parsed, located directly in
+    # the mapping. The one full pass counts types with a byte-level match
+    # instead of decoding every line.
+    chat_count = 0
+    donation_count = 0
+    with open(events_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if not os.fstat(f.fileno()).st_size:
+            return None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first_line, last_line = _edge_lines(mm)
+            if first_line is None:
+                return None
+
+            mm.seek(0)
+            for line in iter(mm.readline, b''):
+                match = _EVENT_TYPE_RE.search(line)
+                if match:
+                    event_type = match.group(1)
+                elif line.strip():
+                    event_type = (orjson.loads(line).get('type') or '').encode()
+                else:
+                    continue
+
+                if event_type == b'chat':
+                    chat_count += 1
+                elif event_type == b'donation':
+                    donation_count += 1
+
+    return {
+        "chat_count": chat_count,
+        "donation_count": donation_count,
+        "first_received_at": orjson.loads(first_line)['received_at'],
+        "last_received_at": orjson.loads(last_line)['received_at'],
+    }
+
+
+def _scan_events_cached(stream_dir: Path, names: set[str]) -> Optional[dict]:
+    """Scan a stream's events.jsonl, reusing the result cached next to it.
+
+    The cache is keyed by the events file's mtime and size, so it is reused
+    for finished streams and invalidated by any append.
+
+    Args:
+        stream_dir: Stream directory containing events.jsonl
+        names: Entry names in stream_dir
+
+    Returns:
+        Scan result from _scan_events
+    """
+    events_file = stream_dir / "events.jsonl"
+    cache_file = stream_dir / STATS_CACHE_FILE
+
+    st = events_file.stat()
+    key = [st.st_mtime_ns, st.st_size]
+
+    if STATS_CACHE_FILE in names:
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+            if cached.get("key") == key:
+                return cached["scan"]
+        except (OSError, orjson.JSONDecodeError, KeyError):
+            pass
+
+    scan = _scan_events(events_file)
+
+    # Write atomically so a concurrent run never reads a partial cache; the
+    # output directory may be read-only, in which case just skip caching
+    tmp_file = cache_file.with_name(f"{STATS_CACHE_FILE}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(orjson.dumps({"key": key, "scan": scan}))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write stats cache {cache_file}: {e}")
+
+    return scan
+
+
+def _stat_stream(stream_dir: Path) -> Optional[dict]:
+    """Compute collection statistics for one stream directory.
+
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Returns:
+        Statistics dictionary, or None if the stream has no events
+    """
+    # One directory listing answers all existence checks below
+    with os.scandir(stream_dir) as entries:
+        names = {entry.name for entry in entries}
+
+    if "events.jsonl" not in names:
+        return None
+
+    # Parse directory name
+    dir_name = stream_dir.name
+    date_str = stream_dir.parent.name
+
+    # Load collection report if available
+    report = {}
+    if "collection_report.json" in names:
+        report = orjson.loads((stream_dir / "collection_report.json").read_bytes())
+
+    # The collector reports its totals along with the events.jsonl size they
+    # describe; only rescan the file if they're missing or out of date
+    if "events_size" in report and report["events_size"] == (stream_dir / "events.jsonl").stat().st_size:
+        scan = {key: report[key] for key in _SCAN_KEYS}
+    else:
+        scan = _scan_events_cached(stream_dir, names)
+    if scan is None:
+        return None
+    chat_count = scan["chat_count"]
+    donation_count = scan["donation_count"]
+
+    # Parse timestamps (UTC -> KST); fromisoformat accepts the "Z" suffix
+    # directly since Python 3.11
+    start_time_utc = datetime.fromisoformat(scan['first_received_at'])
+    end_time_utc = datetime.fromisoformat(scan['last_received_at'])
+    start_time = start_time_utc.astimezone(KST)
+    end_time = end_time_utc.astimezone(KST)
+    duration_sec = (end_time - start_time).total_seconds()
+    duration_min = duration_sec / 60
+
+    # Chat rate
+    chat_per_min = chat_count / duration_min if duration_min > 0 else 0
+
+    reconnect_count = None
+    error_count = None
+    if "collection_report.json" in names:
+        reconnect_count = report.get('reconnect_count', 0)
+        error_count = report.get('error_count', 0)
+
+    return {
+        "date_str": date_str,
+        "dir_name": dir_name,
+        "start_time": start_time,
+        "end_time": end_time,
+        "duration_min": duration_min,
+        "chat_count": chat_count,
+        "donation_count": donation_count,
+        "chat_per_min": chat_per_min,
+        "reconnect_count": reconnect_count,
+        "error_count": error_count,
+    }
+
+
 @cli.command()
 @click.option(
     "--output",
@@ -377,8 +604,6 @@ def plot(ts: Path, peaks: Path, topics_file: Path, out: Path, title: str):
 )
 def stats(output: Path, date: str):
     """Show collection statistics for all streams."""
-    from datetime import datetime
-
     output_path = Path(output)
     if not output_path.exists():
         click.echo(f"❌ Output directory not found: {output_path}")
@@ -389,88 +614,66 @@ def stats(output: Path, date: str):
     if date:
         date_dir = output_path / date
         if date_dir.exists():
-            stream_dirs = [d for d in date_dir.iterdir() if d.is_dir()]
+            stream_dirs = _list_subdirs(date_dir)
     else:
-        for date_dir in sorted(output_path.iterdir()):
-            if date_dir.is_dir():
-                stream_dirs.extend([d for d in date_dir.iterdir() if d.is_dir()])
+        # Listing each date directory is latency-bound (notably on network
+        # storage), so overlap the listings in threads
+        date_dirs = _list_subdirs(output_path)
+        with ThreadPoolExecutor(max_workers=min(32, len(date_dirs) or 1)) as executor:
+            for subdirs in executor.map(_list_subdirs, date_dirs):
+                stream_dirs.extend(subdirs)
 
     if not stream_dirs:
         click.echo("📭 No streams found")
         return
 
-    click.echo(f"\n{'='*80}")
-    click.echo(f"  📊 NokChart Collection Statistics")
-    click.echo(f"{'='*80}\n")
+    # Each stream is an independent scan of its events file, so fan them out
+    with ProcessPoolExecutor(max_workers=min(len(stream_dirs), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(_stat_stream, sorted(stream_dirs)))
+
+    # Collect the report and write it once instead of one echo per line
+    lines = []
+    lines.append(f"\n{'='*80}")
+    lines.append(f"  📊 NokChart Collection Statistics")
+    lines.append(f"{'='*80}\n")
 
     total_chats = 0
     total_donations = 0
     total_duration = 0
 
-    for stream_dir in sorted(stream_dirs):
-        events_file = stream_dir / "events.jsonl"
-        if not events_file.exists():
-            continue
-
-        # Parse directory name
-        dir_name = stream_dir.name
-        date_str = stream_dir.parent.name
-
-        # Load events
-        events = []
-        with open(events_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    events.append(json.loads(line))
-
-        if not events:
+    for result in results:
+        if result is None:
             continue
 
-        # Calculate statistics
-        chat_count = sum(1 for e in events if e.get('type') == 'chat')
-        donation_count = sum(1 for e in events if e.get('type') == 'donation')
-
-        # Parse timestamps (UTC -> KST)
-        from datetime import datetime, timezone, timedelta
-        kst = timezone(timedelta(hours=9))
-        start_time_utc = datetime.fromisoformat(events[0]['received_at'].replace('Z', '+00:00'))
-        end_time_utc = datetime.fromisoformat(events[-1]['received_at'].replace('Z', '+00:00'))
-        start_time = start_time_utc.astimezone(kst)
-        end_time = end_time_utc.astimezone(kst)
-        duration_sec = (end_time - start_time).total_seconds()
-        duration_min = duration_sec / 60
-
-        # Chat rate
-        chat_per_min = chat_count / duration_min if duration_min > 0 else 0
-
-        # Load collection report if available
-        report_file = stream_dir / "collection_report.json"
-        reconnect_count = None
-        error_count = None
-        if report_file.exists():
-            with open(report_file, 'r') as f:
-                report = json.load(f)
-                reconnect_count = report.get('reconnect_count', 0)
-                error_count = report.get('error_count', 0)
+        date_str = result["date_str"]
+        dir_name = result["dir_name"]
+        start_time = result["start_time"]
+        end_time = result["end_time"]
+        duration_min = result["duration_min"]
+        chat_count = result["chat_count"]
+        donation_count = result["donation_count"]
+        chat_per_min = result["chat_per_min"]
+        reconnect_count = result["reconnect_count"]
+        error_count = result["error_count"]
 
         # Display
-        click.echo(f"📅 {date_str}")
-        click.echo(f"📁 {dir_name}")
-        click.echo(f"")
-        click.echo(f"  ⏱️  방송 시간: {start_time.strftime('%H:%M:%S')} ~ {end_time.strftime('%H:%M:%S')} ({duration_min:.1f}분)")
-        click.echo(f"  💬 채팅 수: {chat_count:,}개")
-        click.echo(f"  💰 후원 수: {donation_count}개")
-        click.echo(f"  📈 분당 채팅: {chat_per_min:.1f}개/분")
+        lines.append(f"📅 {date_str}")
+        lines.append(f"📁 {dir_name}")
+        lines.append(f"")
+        lines.append(f"  ⏱️  방송 시간: {start_time.strftime('%H:%M:%S')} ~ {end_time.strftime('%H:%M:%S')} ({duration_min:.1f}분)")
+        lines.append(f"  💬 채팅 수: {chat_count:,}개")
+        lines.append(f"  💰 후원 수: {donation_count}개")
+        lines.append(f"  📈 분당 채팅: {chat_per_min:.1f}개/분")
 
         if reconnect_count is not None:
             status = "✅" if reconnect_count == 0 else "⚠️"
-            click.echo(f"  {status} 재연결: {reconnect_count}회")
+            lines.append(f"  {status} 재연결: {reconnect_count}회")
 
         if error_count is not None and error_count > 0:
-            click.echo(f"  ❌ 에러: {error_count}회")
+            lines.append(f"  ❌ 에러: {error_count}회")
 
-        click.echo(f"")
-        click.echo(f"{'-'*80}\n")
+        lines.append(f"")
+        lines.append(f"{'-'*80}\n")
 
         total_chats += chat_count
         total_donations += donation_count
@@ -478,15 +681,17 @@ def stats(output: Path, date: str):
 
     # Summary
     if total_duration > 0:
-        click.echo(f"{'='*80}")
-        click.echo(f"  📊 전체 요약")
-        click.echo(f"{'='*80}")
-        click.echo(f"  총 방송 수: {len(stream_dirs)}개")
-        click.echo(f"  총 방송 시간: {total_duration:.1f}분 ({total_duration/60:.1f}시간)")
-        click.echo(f"  총 채팅 수: {total_chats:,}개")
-        click.echo(f"  총 후원 수: {total_donations}개")
-        click.echo(f"  평균 분당 채팅: {total_chats/total_duration:.1f}개/분")
-        click.echo(f"{'='*80}\n")
+        lines.append(f"{'='*80}")
+        lines.append(f"  📊 전체 요약")
+        lines.append(f"{'='*80}")
+        lines.append(f"  총 방송 수: {len(stream_dirs)}개")
+        lines.append(f"  총 방송 시간: {total_duration:.1f}분 ({total_duration/60:.1f}시간)")
+        lines.append(f"  총 채팅 수: {total_chats:,}개")
+        lines.append(f"  총 후원 수: {total_donations}개")
+        lines.append(f"  평균 분당 채팅: {total_chats/total_duration:.1f}개/분")
+        lines.append(f"{'='*80}\n")
+
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -514,6 +719,11 @@ def stats(output: Path, date: str):
 )
 def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: int):
     """Process a completed stream: build time series, detect peaks, analyze topics, and generate chart."""
+    from nokchart.aggregation import Aggregator
+    from nokchart.peak_detection import PeakDetector
+    from nokchart.topic_analysis import TopicAnalyzer
+    from nokchart.visualization import ChartGenerator
+
     logger.info(f"Processing stream directory: {stream_dir}")
 
     events_file = stream_dir / "events.jsonl"
@@ -521,9 +731,10 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
         logger.error(f"events.jsonl not found in {stream_dir}")
         sys.exit(1)
 
-    # Step 1: Build time series
+    # Step 1: Build time series, keeping chat text so topic analysis can reuse
+    # this read of events.jsonl instead of scanning the file again
     click.echo("Step 1: Building time series...")
-    aggregator = Aggregator(events_file)
+    aggregator = Aggregator(events_file, keep_chat_text=with_topics)
     output_files = aggregator.build_time_series(
         output_dir=stream_dir,
         bucket_sizes=[10, 60, 300],  # 10초, 1분, 5분 단위
@@ -534,6 +745,15 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
         logger.error("Failed to build time series")
         sys.exit(1)
 
+    # Topic analysis only needs the chat text, so run it in the background
+    # and let it overlap with detecting peaks
+    topics_future = None
+    if with_topics:
+        analyzer = TopicAnalyzer(segment_sec=segment_sec, top_k=5, min_keyword_freq=3)
+        executor = ThreadPoolExecutor(max_workers=1)
+        topics_future = executor.submit(analyzer.analyze_chats, aggregator.chat_messages, stream_id)
+        executor.shutdown(wait=False)
+
     ts_file = output_files.get("10s")  # Use 10-second bucket for peak detection
     click.echo(f"  Created: {ts_file}")
 
@@ -541,7 +761,10 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
     click.echo("\nStep 2: Detecting peaks...")
     click.echo("  [1차] 10초 슬라이딩 윈도우로 대략적 피크 탐지...")
     click.echo("  [2차] 1초 단위로 정밀 시작점 보정...")
-    detector = PeakDetector(ts_file)
+    # The time series are still in memory from step 1, so later stages
+    # use those frames instead of reading the CSV back
+    ts_df = aggregator.time_series["10s"]
+    detector = PeakDetector(ts_file, time_series=ts_df)
     peaks_output = detector.detect_peaks(
         stream_id=stream_id,
         window_sec=60,
@@ -560,12 +783,11 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
     topics_file = None
     if with_topics:
         click.echo("\nStep 3: Analyzing topics...")
-        analyzer = TopicAnalyzer(segment_sec=segment_sec, top_k=5, min_keyword_freq=3)
-        topics_output = analyzer.analyze_events_file(events_file, stream_id)
+        topics_output = topics_future.result()
 
         topics_file = stream_dir / "topics.json"
-        with open(topics_file, "w", encoding="utf-8") as f:
-            f.write(topics_output.model_dump_json(indent=2))
+        with open(topics_file, "wb") as f:
+            f.write(orjson.dumps(topics_output.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
 
         click.echo(f"  Created: {topics_file}")
         click.echo(f"  Analyzed {len(topics_output.segments)} segments")
@@ -581,7 +803,7 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
     step_num = 4 if with_topics else 3
     click.echo(f"\nStep {step_num}: Generating chart...")
     chart_file = stream_dir / "chart_chat_rate.png"
-    generator = ChartGenerator(ts_file)
+    generator = ChartGenerator(ts_file, time_series=ts_df)
     generator.plot_chat_rate(
         output_file=chart_file,
         peaks=peaks_output,
@@ -612,8 +834,8 @@ def process(stream_dir: Path, stream_id: str, with_topics: bool, segment_sec: in
         report["topics_segments"] = len(topics_output.segments) if topics_output else 0
 
     report_file = stream_dir / "report.json"
-    with open(report_file, "w") as f:
-        json.dump(report, f, indent=2)
+    with open(report_file, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
     click.echo(f"  Created: {report_file}")
     click.echo("\nProcessing complete!")
@@ -1,10 +1,11 @@
 """Chat event collector for Chzzk streams."""
 
 import asyncio
-import json
 import logging
 import os
-from datetime import datetime, timezone
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,18 @@ from nokchart.models import ChatEvent, EventType, StreamInfo, StreamStatus
 
 logger = logging.getLogger(__name__)
 
+# Pending bytes that wake the events.jsonl writer early
+EVENTS_BUFFER_SIZE = 64 * 1024
+
+# Longest time a saved event waits before the writer puts it on disk
+EVENTS_FLUSH_INTERVAL = 1.0
+
+# Lines per os.writev call, within Linux's IOV_MAX of 1024
+_WRITEV_MAX_LINES = 1024
+_HAS_WRITEV = hasattr(os, "writev")
+
+_ONE_MS = timedelta(milliseconds=1)
+
 
 class ChzzkChannelClient:
     """
@@ -33,7 +46,11 @@ class ChzzkChannelClient:
         """
         self.channel_id = channel_id
         self.client: Optional[ChzzkChatClient] = None
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        # Events from the chat handlers, read by connect_chat. There is a
+        # single producer and consumer on one loop, so a deque plus a wakeup
+        # Event does the job without asyncio.Queue's per-item futures.
+        self._event_queue: deque = deque()
+        self._event_available = asyncio.Event()
         self._connected = False
         self._connect_task: Optional[asyncio.Task] = None
         self._status_client = None  # Reusable client for status checks
@@ -67,7 +84,11 @@ class ChzzkChannelClient:
                 nickname = "Unknown"
                 user_id_hash = ""
 
-            logger.debug(f"📨 Received chat from {self.channel_id}: {nickname}: {message.content}")
+            # Per-message debug logs use lazy %-args so nothing is formatted
+            # unless debug logging is on
+            logger.debug("📨 Received chat from %s: %s: %s", self.channel_id, nickname, message.content)
+            # This dict is also persisted as ChatEvent.raw, so it is built
+            # once here and handed to the collector as-is
             event = {
                 'type': 'chat',
                 'user': nickname,
@@ -76,8 +97,8 @@ class ChzzkChannelClient:
                 'message_id': message.msg_id,
                 'timestamp': datetime.now(timezone.utc),
             }
-            await self._event_queue.put(event)
-            logger.debug(f"✅ Queued chat event from {self.channel_id}")
+            self._put_event(event)
+            logger.debug("✅ Queued chat event from %s", self.channel_id)
 
         @self.client.event
         async def on_donation(message: DonationMessage):
@@ -99,8 +120,8 @@ class ChzzkChannelClient:
                 'amount': message.amount or 0,
                 'timestamp': datetime.now(timezone.utc),
             }
-            await self._event_queue.put(event)
-            logger.debug(f"✅ Queued donation event from {self.channel_id}")
+            self._put_event(event)
+            logger.debug("✅ Queued donation event from %s", self.channel_id)
 
         @self.client.event
         async def on_connect():
@@ -119,7 +140,7 @@ class ChzzkChannelClient:
                 self._disconnect_notified = True
 
                 # Put a special event to signal potential stream end check
-                await self._event_queue.put({
+                self._put_event({
                     'type': 'system',
                     'event': 'disconnect',
                     'timestamp': datetime.now(timezone.utc),
@@ -127,6 +148,11 @@ class ChzzkChannelClient:
 
         logger.info(f"Registered event handlers for channel {self.channel_id}")
 
+    def _put_event(self, event: dict):
+        """Queue an event for connect_chat and wake it."""
+        self._event_queue.append(event)
+        self._event_available.set()
+
     async def get_stream_status(self) -> Optional[StreamInfo]:
         """
         Get current stream status for this channel.
@@ -183,36 +209,36 @@ class ChzzkChannelClient:
         logger.info(f"Starting ChatClient connection for {self.channel_id}")
         self._connect_task = asyncio.create_task(self.client.start())
 
+        # Wake the loop below when the client task ends instead of polling it;
+        # the task rides along so a late signal from an earlier connection
+        # can be told apart
+        self._connect_task.add_done_callback(
+            lambda task: self._put_event(
+                {'type': 'system', 'event': 'client_stopped', 'task': task}
+            )
+        )
+
         # Wait a bit for connection to establish
         await asyncio.sleep(2)
 
         try:
             # Yield events from queue
             while True:
-                try:
-                    event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-
-                    # Filter out system events (used internally for disconnect notifications)
-                    if event.get('type') == 'system':
-                        logger.debug(f"System event received: {event.get('event')}")
-                        continue
-
-                    yield event
-                except asyncio.TimeoutError:
-                    # Check if client task is still running
-                    if self._connect_task and self._connect_task.done():
-                        # Log exception if task failed
-                        try:
-                            exception = self._connect_task.exception()
-                            if exception:
-                                logger.error(f"Chat client task failed: {exception}", exc_info=exception)
-                            else:
-                                logger.warning(f"Chat client task finished unexpectedly (no exception)")
-                        except Exception as e:
-                            logger.warning(f"Chat client task finished (could not get exception: {e})")
+                while not self._event_queue:
+                    self._event_available.clear()
+                    await self._event_available.wait()
+                event = self._event_queue.popleft()
+
+                # Filter out system events (used internally for disconnect notifications)
+                if event.get('type') == 'system':
+                    logger.debug(f"System event received: {event.get('event')}")
+                    if event.get('event') == 'client_stopped' and event['task'] is self._connect_task:
+                        self._log_client_exit(event['task'])
                         break
                     continue
 
+                yield event
+
         except Exception as e:
             logger.error(f"Error in chat event handler for {self.channel_id}: {e}", exc_info=True)
             raise
@@ -231,6 +257,18 @@ class ChzzkChannelClient:
                 self.client = None
             logger.info(f"Chat connection ended for {self.channel_id}, client reset for reuse")
 
+    def _log_client_exit(self, task: asyncio.Task):
+        """Log why the chat client task finished."""
+        if task.cancelled():
+            logger.warning("Chat client task was cancelled")
+            return
+
+        exception = task.exception()
+        if exception:
+            logger.error(f"Chat client task failed: {exception}", exc_info=exception)
+        else:
+            logger.warning(f"Chat client task finished unexpectedly (no exception)")
+
     async def close(self):
         """Close client connection and reset state for reuse."""
         if self._connect_task:
@@ -249,11 +287,8 @@ class ChzzkChannelClient:
             await self._status_client.close()
 
         # Clear event queue
-        while not self._event_queue.empty():
-            try:
-                self._event_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._event_queue.clear()
+        self._event_available.clear()
 
         self._connected = False
         logger.info(f"Closed and reset ChatClient for channel {self.channel_id}")
@@ -275,6 +310,24 @@ class Collector:
         self.events_file = output_dir / "events.jsonl"
         self.running = False
         self.event_count = 0
+        # Per-type totals and received_at range of the saved events, reported
+        # so `stats` doesn't have to rescan events.jsonl
+        self.chat_count = 0
+        self.donation_count = 0
+        self.first_received_at: Optional[datetime] = None
+        self.last_received_at: Optional[datetime] = None
+        # Size of events.jsonl before this collector started appending
+        self._initial_events_size = 0
+        # Serialized events waiting for the writer task; see _writer_loop
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._write_wakeup = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_stopping = False
+        self._events_fd: Optional[int] = None
+        # Serializes writes, so a batch still being written by a worker thread
+        # finishes before the final drain in _stop_writer appends after it
+        self._write_lock = threading.Lock()
         self.start_time: Optional[datetime] = None
         self.last_event_time: Optional[datetime] = None
         self.idle_timeout_minutes = idle_timeout_minutes
@@ -289,9 +342,13 @@ class Collector:
         self.running = True
         self.start_time = datetime.now(timezone.utc)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.events_file.exists():
+            self._initial_events_size = self.events_file.stat().st_size
 
         logger.info(f"Starting collection for stream {self.stream_info.stream_id}")
 
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
         try:
             async for event in self._collect_events():
                 if not self.running:
@@ -306,6 +363,7 @@ class Collector:
             logger.error(f"Error during collection: {e}", exc_info=True)
             raise
         finally:
+            await self._stop_writer()
             logger.info(
                 f"Collection stopped. Total events: {self.event_count}, "
                 f"Duration: {datetime.now(timezone.utc) - self.start_time}"
@@ -315,6 +373,103 @@ class Collector:
         """Stop collecting events."""
         self.running = False
 
+    def flush(self):
+        """Write any pending events to events.jsonl.
+
+        Only drains synchronously while the writer task isn't running, so
+        batches are never written out of order.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self._write_batch(self._take_pending())
+
+    def _take_pending(self) -> list[bytes]:
+        """Remove and return all pending serialized events."""
+        batch = self._pending
+        self._pending = []
+        self._pending_size = 0
+        self._write_wakeup.clear()
+        return batch
+
+    def _write_batch(self, batch: list[bytes]):
+        """Append a batch of serialized events to events.jsonl.
+
+        Lines go out with os.writev, one call per _WRITEV_MAX_LINES, so the
+        batch is never concatenated into a single copy first.
+        """
+        if not batch:
+            return
+        with self._write_lock:
+            if self._events_fd is None:
+                self._events_fd = os.open(
+                    self.events_file,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+
+            for i in range(0, len(batch), _WRITEV_MAX_LINES):
+                lines = batch[i:i + _WRITEV_MAX_LINES]
+                if _HAS_WRITEV:
+                    written = os.writev(self._events_fd, lines)
+                else:
+                    written = 0
+                # Finish a short (or unsupported) vectored write with plain writes
+                if written < sum(map(len, lines)):
+                    rest = memoryview(b"".join(lines))[written:]
+                    while rest:
+                        rest = rest[os.write(self._events_fd, rest):]
+
+    async def _writer_loop(self):
+        """Write pending events in batches off the event loop.
+
+        Wakes when EVENTS_BUFFER_SIZE bytes are pending or every
+        EVENTS_FLUSH_INTERVAL seconds, and hands the blocking write to a
+        thread so disk latency never stalls the chat connection. Returns once
+        _stop_writer has asked it to and nothing is left to write.
+        """
+        while True:
+            if not self._writer_stopping:
+                try:
+                    await asyncio.wait_for(self._write_wakeup.wait(), timeout=EVENTS_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._take_pending()
+            if batch:
+                await asyncio.to_thread(self._write_batch, batch)
+            elif self._writer_stopping:
+                return
+
+    async def _stop_writer(self):
+        """Let the writer task finish what's pending, then close events.jsonl.
+
+        If the writer task or this one is cancelled (e.g. on Ctrl-C), whatever
+        is still pending is written synchronously before the file is closed.
+        """
+        try:
+            if self._writer_task is not None:
+                self._writer_stopping = True
+                self._write_wakeup.set()
+                try:
+                    await self._writer_task
+                except asyncio.CancelledError:
+                    # Only propagate if this task is the one being cancelled
+                    if asyncio.current_task().cancelling():
+                        raise
+                except Exception as e:
+                    logger.error(f"Failed to write events to {self.events_file}: {e}")
+        finally:
+            self._writer_task = None
+            self._writer_stopping = False
+            try:
+                self._write_batch(self._take_pending())
+            except OSError as e:
+                logger.error(f"Failed to write events to {self.events_file}: {e}")
+            finally:
+                with self._write_lock:
+                    if self._events_fd is not None:
+                        os.close(self._events_fd)
+                        self._events_fd = None
+
     def is_idle(self) -> bool:
         """Check if collector has been idle (no events) for too long.
 
@@ -382,15 +537,24 @@ class Collector:
 
         This generator yields ChatEvent objects from the stream.
         """
+        # Stream start reference for t_ms, resolved once rather than per event
+        stream_start = self.stream_info.start_time if self.start_time else None
+
         # Use the client to connect to chat
         async for raw_event in self.client.connect_chat():
             # Parse raw event into ChatEvent
 
-            # Calculate relative time from stream start
+            # The chat handler stamps each event once on receipt; reuse that
+            # for both the relative time and received_at
+            received_at = raw_event.get('timestamp')
+            if received_at is None:
+                received_at = datetime.now(timezone.utc)
+
+            # Calculate relative time from stream start in whole milliseconds,
+            # with integer timedelta division instead of a float round trip
             t_ms = 0
-            if self.stream_info.start_time and self.start_time:
-                delta = datetime.now(timezone.utc) - self.stream_info.start_time
-                t_ms = int(delta.total_seconds() * 1000)
+            if stream_start:
+                t_ms = (received_at - stream_start) // _ONE_MS
 
             # Determine event type
             event_type = EventType.CHAT
@@ -406,7 +570,7 @@ class Collector:
                 text=raw_event.get('text'),
                 amount=raw_event.get('amount'),
                 message_id=raw_event.get('message_id'),
-                received_at=raw_event.get('timestamp', datetime.now(timezone.utc)),
+                received_at=received_at,
                 raw=raw_event,
             )
 
@@ -415,15 +579,36 @@ class Collector:
     async def _save_event(self, event: ChatEvent):
         """Save event to events.jsonl file."""
         # Update last event time
-        self.last_event_time = datetime.now(timezone.utc)
+        self.last_event_time = event.received_at or datetime.now(timezone.utc)
+
+        # Convert to JSON as a single line. The model's pydantic-core
+        # serializer emits UTF-8 bytes in one pass, without an intermediate
+        # dict. The writer task puts it on disk, so no blocking I/O happens here.
+        payload = ChatEvent.__pydantic_serializer__.to_json(event) + b"\n"
 
-        with open(self.events_file, "a") as f:
-            # Convert to JSON and write as single line
-            event_dict = event.model_dump(mode="json", exclude_none=False)
-            f.write(json.dumps(event_dict, ensure_ascii=False) + "\n")
+        # Surface a failed write (e.g. disk full) here, which stops collection
+        if self._writer_task is not None and self._writer_task.done():
+            self._writer_task.result()
+
+        self._pending.append(payload)
+        self._pending_size += len(payload)
+        if self._pending_size >= EVENTS_BUFFER_SIZE:
+            self._write_wakeup.set()
+
+        if event.type == EventType.CHAT:
+            self.chat_count += 1
+        elif event.type == EventType.DONATION:
+            self.donation_count += 1
+
+        if self.first_received_at is None:
+            self.first_received_at = event.received_at
+        self.last_received_at = event.received_at
 
     def generate_report(self) -> dict:
         """Generate collection report."""
+        # events_size below must cover every event saved so far
+        self.flush()
+
         report = {
             "stream_id": self.stream_info.stream_id,
             "channel_id": self.stream_info.channel_id,
@@ -433,6 +618,15 @@ class Collector:
             "events_file": str(self.events_file),
         }
 
+        # Event totals only describe events.jsonl if this collector wrote all
+        # of it; events_size lets readers check the file hasn't changed since
+        if self._initial_events_size == 0 and self.first_received_at and self.events_file.exists():
+            report["events_size"] = self.events_file.stat().st_size
+            report["chat_count"] = self.chat_count
+            report["donation_count"] = self.donation_count
+            report["first_received_at"] = self.first_received_at.isoformat()
+            report["last_received_at"] = self.last_received_at.isoformat()
+
         # Add client statistics if available
         if self.client and self.client.client:
             report["reconnect_count"] = self.client.client.total_reconnects
@@ -1,12 +1,35 @@
 """Configuration management."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from nokchart.models import Config
 
+# Parsed YAML keyed by path, reused while the file's mtime and size are unchanged
+_yaml_cache: dict[Path, tuple[int, int, Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result if the file is unchanged."""
+    stat = path.stat()
+    cached = _yaml_cache.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    _yaml_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 
 def load_config(config_path: Optional[Path] = None) -> Config:
     """Load configuration from YAML file."""
@@ -17,8 +40,7 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         # Return default config
         return Config()
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(config_path)
 
     return Config(**data)
 
@@ -31,10 +53,9 @@ def load_channels(channels_path: Optional[Path] = None) -> list[str]:
     if not channels_path.exists():
         return []
 
-    with open(channels_path) as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(channels_path)
 
-    return data.get("channels", [])
+    return list(data.get("channels", []))
 
 
 def load_channel_names(channels_path: Optional[Path] = None) -> dict[str, str]:
@@ -1,12 +1,14 @@
 """Peak detection module for finding chat activity peaks."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 
+from nokchart.aggregation import iter_events
 from nokchart.models import Peak, PeaksOutput
 
 logger = logging.getLogger(__name__)
@@ -15,8 +17,15 @@ logger = logging.getLogger(__name__)
 class PeakDetector:
     """Detects peaks in chat activity time series."""
 
-    def __init__(self, time_series_file: Path):
+    def __init__(self, time_series_file: Path, time_series: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            time_series_file: Path to time series CSV file
+            time_series: Already loaded contents of time_series_file; the CSV
+                is only read when this is not given
+        """
         self.time_series_file = time_series_file
+        self.time_series = time_series
 
     def detect_peaks(
         self,
@@ -95,11 +104,14 @@ class PeakDetector:
         Returns:
             Tuple of (DataFrame, bucket_size_sec)
         """
-        if not self.time_series_file.exists():
+        if self.time_series is not None:
+            # Window sums are added as columns, so leave the caller's frame intact
+            df = self.time_series.copy()
+        elif not self.time_series_file.exists():
             logger.error(f"Time series file not found: {self.time_series_file}")
             return pd.DataFrame(), 1
-
-        df = pd.read_csv(self.time_series_file)
+        else:
+            df = pd.read_csv(self.time_series_file)
 
         if "sec" not in df.columns or "chat_count" not in df.columns:
             logger.error("Invalid time series format: missing 'sec' or 'chat_count' columns")
@@ -179,13 +191,18 @@ class PeakDetector:
         else:  # "volume"
             sorted_df = df.sort_values("window_sum", ascending=False)
 
-        for _, row in sorted_df.iterrows():
-            start_sec = int(row["sec"])
+        # Walk plain column arrays; building a Series per row with iterrows()
+        # costs far more than the gap check itself
+        candidates = zip(
+            sorted_df["sec"].to_numpy().tolist(),
+            sorted_df["window_sum"].to_numpy().tolist(),
+            sorted_df["surge_ratio"].to_numpy().tolist(),
+        )
+        for sec, window_sum, surge_ratio in candidates:
+            start_sec = int(sec)
             end_sec = start_sec + window_sec
             # Store the actual chat count as value (for compatibility)
-            value = int(row["window_sum"])
-            # Store surge ratio for analysis
-            surge_ratio = float(row["surge_ratio"])
+            value = int(window_sum)
 
             # Check if this peak overlaps with existing peaks
             if self._is_valid_peak(peaks, start_sec, end_sec, min_gap_sec):
@@ -267,26 +284,25 @@ class PeakDetector:
                 refined_peaks.append(peak)
                 continue
 
-            # Build 1-second buckets for this region
-            sec_counts = region_events.groupby("sec").size().reset_index(name="count")
-
-            # Create full range of seconds (including zeros)
-            all_secs = pd.DataFrame({"sec": range(search_start, search_end)})
-            sec_counts = all_secs.merge(sec_counts, on="sec", how="left").fillna(0)
-            sec_counts["count"] = sec_counts["count"].astype(int)
+            # Build 1-second buckets for this region (including zeros)
+            counts = np.bincount(
+                region_events["sec"].to_numpy() - search_start,
+                minlength=search_end - search_start,
+            )
 
-            # Find best 60-second window with 1-second sliding
+            # Find best window with 1-second sliding. Every window sum comes
+            # from one cumulative sum, so the cost doesn't grow with window_sec;
+            # argmax keeps the earliest of equal windows.
             best_start = peak.start_sec
             best_value = 0
 
-            for start in range(search_start, search_end - window_sec + 1):
-                window_sum = sec_counts[
-                    (sec_counts["sec"] >= start) & (sec_counts["sec"] < start + window_sec)
-                ]["count"].sum()
-
-                if window_sum > best_value:
-                    best_value = window_sum
-                    best_start = start
+            if 0 < window_sec <= len(counts):
+                csum = np.concatenate(([0], np.cumsum(counts)))
+                window_sums = csum[window_sec:] - csum[:-window_sec]
+                best = int(np.argmax(window_sums))
+                if window_sums[best] > best_value:
+                    best_value = int(window_sums[best])
+                    best_start = search_start + best
 
             # Create refined peak
             refined_peak = Peak(
@@ -315,29 +331,28 @@ class PeakDetector:
         Returns:
             DataFrame with 'sec' column (seconds from stream start)
         """
-        events = []
         try:
-            with open(events_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        event = json.loads(line)
-                        if "t_ms" in event:
-                            events.append({"sec": event["t_ms"] // 1000})
+            # Collect seconds straight into a typed array instead of building
+            # a list of dicts for DataFrame inference
+            secs = np.fromiter(
+                (event["t_ms"] // 1000 for event in iter_events(events_file) if "t_ms" in event),
+                dtype=np.int64,
+            )
         except Exception as e:
             logger.error(f"Error loading events for refinement: {e}")
             return pd.DataFrame()
 
-        if not events:
+        if not len(secs):
             return pd.DataFrame()
 
-        return pd.DataFrame(events)
+        return pd.DataFrame({"sec": secs})
 
     def save_peaks(self, peaks_output: PeaksOutput, output_file: Path):
         """Save peaks to JSON file."""
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w") as f:
-            json.dump(peaks_output.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(peaks_output.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved peaks to {output_file}")
 
@@ -6,7 +6,7 @@ import re
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from pydantic import BaseModel
 
@@ -137,6 +137,25 @@ class TopicAnalyzer:
 
         # Load events
         events = self._load_events(events_file)
+        return self._analyze(events, stream_id)
+
+    def analyze_chats(self, chats: Iterable[tuple[int, str]], stream_id: str) -> TopicsOutput:
+        """
+        Extract topics from chat messages that are already in memory.
+
+        Args:
+            chats: (t_ms, text) pairs, e.g. Aggregator.chat_messages
+            stream_id: Stream ID for the output
+
+        Returns:
+            TopicsOutput with segments and keywords
+        """
+        events = [ChatEvent(t_ms=t_ms, text=text) for t_ms, text in chats if text]
+        logger.info(f"Analyzing topics from {len(events)} chat events")
+        return self._analyze(events, stream_id)
+
+    def _analyze(self, events: list[ChatEvent], stream_id: str) -> TopicsOutput:
+        """Build the topics output for loaded chat events."""
         if not events:
             logger.warning("No events found")
             return TopicsOutput(stream_id=stream_id, segment_sec=self.segment_sec, segments=[])
@@ -4,6 +4,12 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+import matplotlib
+
+# Charts are only ever saved to PNG, so select the non-interactive backend
+# before pyplot loads to skip GUI toolkit probing on headless servers
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.font_manager as fm
@@ -36,8 +42,15 @@ _setup_korean_font()
 class ChartGenerator:
     """Generates charts from time series data."""
 
-    def __init__(self, time_series_file: Path):
+    def __init__(self, time_series_file: Path, time_series: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            time_series_file: Path to time series CSV file
+            time_series: Already loaded contents of time_series_file; the CSV
+                is only read when this is not given
+        """
         self.time_series_file = time_series_file
+        self.time_series = time_series
 
     def plot_chat_rate(
         self,
@@ -82,7 +95,7 @@ class ChartGenerator:
                 end_sec = min((i + 1) * max_sec_per_chart, max_sec)
 
                 # Filter data for this segment
-                segment_df = df[(df["sec"] >= start_sec) & (df["sec"] < end_sec)].copy()
+                segment_df = df[(df["sec"] >= start_sec) & (df["sec"] < end_sec)]
                 if segment_df.empty:
                     continue
 
@@ -217,6 +230,9 @@ class ChartGenerator:
 
     def _load_time_series(self) -> pd.DataFrame:
         """Load time series from CSV file."""
+        if self.time_series is not None:
+            return self.time_series
+
         if not self.time_series_file.exists():
             logger.error(f"Time series file not found: {self.time_series_file}")
             return pd.DataFrame()
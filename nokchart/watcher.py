@@ -6,6 +6,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
+from nokchart.chat import close_session
 from nokchart.collector import ChzzkChannelClient, Collector
 from nokchart.models import Config, StreamStatus
 from nokchart.aggregation import Aggregator
@@ -331,8 +334,8 @@ class Watcher:
             topics_output = analyzer.analyze_events_file(events_file, stream_id)
 
             topics_file = output_dir / "topics.json"
-            with open(topics_file, "w", encoding="utf-8") as f:
-                f.write(topics_output.model_dump_json(indent=2))
+            with open(topics_file, "wb") as f:
+                f.write(orjson.dumps(topics_output.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
             logger.info(f"[{stream_id}] Created topics: {topics_file} ({len(topics_output.segments)} segments)")
 
             # Step 4: Generate chart
@@ -348,7 +351,6 @@ class Watcher:
 
             # Create report
             report_file = output_dir / "report.json"
-            import json
             report = {
                 "stream_id": stream_id,
                 "processing_completed": datetime.now().isoformat(),
@@ -364,8 +366,8 @@ class Watcher:
                     "chart": str(chart_file),
                 }
             }
-            with open(report_file, "w") as f:
-                json.dump(report, f, indent=2)
+            with open(report_file, "wb") as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
             logger.info(f"[{stream_id}] Data processing completed! Report: {report_file}")
 
@@ -392,3 +394,6 @@ class Watcher:
         # Close all channel clients
         for client in self.clients.values():
             await client.close()
+
+        # Close the HTTP session shared by all channels
+        await close_session()
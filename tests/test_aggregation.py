@@ -0,0 +1,131 @@
+"""Tests for time series aggregation."""
+
+import json
+
+import pandas as pd
+
+from nokchart.aggregation import Aggregator
+
+
+def _write_events(path, events):
+    with open(path, "w") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _chat(t_ms, received_at="2026-01-22T03:00:00.500000Z"):
+    return {"type": "chat", "t_ms": t_ms, "received_at": received_at}
+
+
+def test_get_statistics(tmp_path):
+    """Test basic statistics over chat and donation events."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(
+        events_file,
+        [
+            _chat(1000),
+            {"type": "donation", "t_ms": 2000, "received_at": "2026-01-22T03:00:01.500000Z"},
+            _chat(6000),
+        ],
+    )
+
+    stats = Aggregator(events_file).get_statistics()
+
+    assert stats["total_events"] == 3
+    assert stats["chat_events"] == 2
+    assert stats["donation_events"] == 1
+    assert stats["duration_sec"] == 5.0
+
+
+def test_get_statistics_missing_file(tmp_path):
+    """Test statistics for a missing events file."""
+    assert Aggregator(tmp_path / "events.jsonl").get_statistics() == {}
+
+
+def test_build_time_series_fills_gaps(tmp_path):
+    """Test bucketing fills empty buckets with zero counts."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(events_file, [_chat(0), _chat(500), _chat(3200), _chat(12000)])
+
+    output_files = Aggregator(events_file).build_time_series(
+        output_dir=tmp_path, bucket_sizes=[1, 5], rolling_window=0
+    )
+
+    ts_1s = pd.read_csv(output_files["1s"])
+    assert ts_1s["sec"].tolist() == list(range(0, 13))
+    assert ts_1s["chat_count"].tolist() == [2, 0, 0, 1] + [0] * 8 + [1]
+
+    ts_5s = pd.read_csv(output_files["5s"])
+    assert ts_5s["sec"].tolist() == [0, 5, 10]
+    assert ts_5s["chat_count"].tolist() == [3, 0, 1]
+
+
+def test_build_time_series_rolling(tmp_path):
+    """Test rolling average column on 60-second buckets."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(events_file, [_chat(0), _chat(1000), _chat(61000), _chat(125000)])
+
+    output_files = Aggregator(events_file).build_time_series(
+        output_dir=tmp_path, bucket_sizes=[60], rolling_window=120
+    )
+
+    ts_60s = pd.read_csv(output_files["60s"])
+    assert ts_60s["chat_count"].tolist() == [2, 1, 1]
+    assert ts_60s["chat_count_rolling_120s"].tolist() == [2.0, 1.5, 1.0]
+    assert ts_60s["timestamp"].iloc[0].endswith("+09:00")
+
+
+def test_build_time_series_mixed_timestamp_precision(tmp_path):
+    """Test received_at values with and without fractional seconds."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(
+        events_file,
+        [
+            _chat(0, received_at="2026-01-22T03:00:00Z"),
+            _chat(1500, received_at="2026-01-22T03:00:01.500000Z"),
+        ],
+    )
+
+    output_files = Aggregator(events_file).build_time_series(
+        output_dir=tmp_path, bucket_sizes=[1], rolling_window=0
+    )
+
+    ts_1s = pd.read_csv(output_files["1s"])
+    assert ts_1s["timestamp"].tolist() == [
+        "2026-01-22 12:00:00+09:00",
+        "2026-01-22 12:00:01+09:00",
+    ]
+
+
+def test_build_time_series_keeps_chat_text(tmp_path):
+    """Test chat text is kept for reuse only when requested."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(events_file, [{**_chat(1000), "text": "ㅋㅋㅋ"}, _chat(2000)])
+
+    aggregator = Aggregator(events_file, keep_chat_text=True)
+    aggregator.build_time_series(output_dir=tmp_path, bucket_sizes=[1], rolling_window=0)
+    assert aggregator.chat_messages == [(1000, "ㅋㅋㅋ")]
+
+    aggregator = Aggregator(events_file)
+    aggregator.build_time_series(output_dir=tmp_path, bucket_sizes=[1], rolling_window=0)
+    assert aggregator.chat_messages == []
+
+
+def test_get_statistics_reuses_build_pass(tmp_path):
+    """Test statistics come from the build_time_series read of the file."""
+    events_file = tmp_path / "events.jsonl"
+    _write_events(
+        events_file,
+        [_chat(1000), {"type": "donation", "t_ms": 4000, "received_at": "2026-01-22T03:00:03.500000Z"}],
+    )
+
+    aggregator = Aggregator(events_file)
+    aggregator.build_time_series(output_dir=tmp_path, bucket_sizes=[1], rolling_window=0)
+    events_file.unlink()
+
+    assert aggregator.get_statistics() == {
+        "total_events": 2,
+        "chat_events": 1,
+        "donation_events": 1,
+        "duration_sec": 3.0,
+    }
@@ -0,0 +1,75 @@
+"""Tests for the chat event collector."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from nokchart.collector import Collector
+from nokchart.models import StreamInfo, StreamStatus
+
+
+class _FakeClient:
+    """Stands in for ChzzkChannelClient, yielding a fixed number of chats."""
+
+    client = None
+
+    def __init__(self, count, hang=False):
+        self.count = count
+        self.hang = hang
+
+    async def connect_chat(self):
+        for i in range(self.count):
+            yield {
+                "type": "chat",
+                "user": "user",
+                "text": f"message {i}",
+                "timestamp": datetime.now(timezone.utc),
+            }
+        if self.hang:
+            await asyncio.Event().wait()
+
+
+def _collector(tmp_path, client):
+    stream_info = StreamInfo(
+        stream_id="test_stream",
+        channel_id="test_channel",
+        status=StreamStatus.LIVE,
+        start_time=datetime.now(timezone.utc),
+    )
+    return Collector(stream_info, tmp_path, client=client)
+
+
+def _read_texts(events_file):
+    with open(events_file) as f:
+        return [json.loads(line)["text"] for line in f]
+
+
+def test_start_writes_all_events(tmp_path):
+    """Test that every collected event reaches events.jsonl in order."""
+    collector = _collector(tmp_path, _FakeClient(2500))
+
+    asyncio.run(collector.start())
+
+    assert _read_texts(collector.events_file) == [f"message {i}" for i in range(2500)]
+    assert collector._events_fd is None
+
+
+def test_cancelled_start_writes_pending_events(tmp_path):
+    """Test that events saved before cancellation (e.g. Ctrl-C) are not lost."""
+    collector = _collector(tmp_path, _FakeClient(5, hang=True))
+
+    async def run():
+        task = asyncio.create_task(collector.start())
+        while collector.event_count < 5:
+            await asyncio.sleep(0)
+
+        # asyncio.run cancels every remaining task on shutdown
+        collector._writer_task.cancel()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+    assert _read_texts(collector.events_file) == [f"message {i}" for i in range(5)]
+    assert collector._pending == []
+    assert collector._events_fd is None